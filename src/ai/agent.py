@@ -7,20 +7,22 @@ using the Pydantic AI agent framework with proper tool calling.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from typing import TYPE_CHECKING
 
-from pydantic_ai import Agent, BinaryContent, RunContext
-
 from ai.context import BotDependencies
+from ai.response_cache import make_cache_key, normalize_prompt, response_cache
 from ai.token_tracker import token_tracker
 from core.command import CommandContext, command_loader
-from core.logger import log_debug, log_error, log_info, log_warning
+from core.logger import is_debug_enabled, log_debug, log_error, log_info, log_warning
 from core.permissions import check_command_permissions
 from core.runtime_config import runtime_config
 
 if TYPE_CHECKING:
+    from pydantic_ai import Agent, RunContext
+
     from core.client import BotClient
     from core.message import MessageHelper
 
@@ -48,6 +50,31 @@ CRITICAL RULES:
 - Max 1-2 tool calls per request
 """
 
+CHAT_CONTEXT_TEMPLATE = """
+Chat context:
+- Chat: {chat}
+- Is group: {is_group}
+- Bot JID: {bot_jid} (this is YOU, the bot)
+- Bot LID: {bot_lid} (this is also YOU, the bot)
+Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not asking you to mention yourself.
+"""
+
+MESSAGE_CONTEXT_TEMPLATE = """
+Current message:
+- Sender name: {sender_name}
+- Sender JID for mentioning: {sender_id} (use @{sender_id} with with_mentions=True to mention them)
+- Message type: {message_type}
+- Is reply to another message: {is_reply}{quoted_context}
+"""
+
+PROVIDER_KEY_ENV = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "google": ("GOOGLE_API_KEY", "GEMINI_API_KEY"),
+}
+
+_MENTION_RE = re.compile(r"@(\d+)")
+
 
 def _normalize_actions(values: object) -> set[str]:
     """Normalize action values from config for policy checks."""
@@ -76,7 +103,16 @@ def _is_ai_action_allowed(command_name: str) -> bool:
 
 
 def _create_agent() -> Agent:
-    """Create and configure the Pydantic AI agent with all tools."""
+    """
+    Create and configure the Pydantic AI agent with all tools.
+
+    pydantic_ai is imported here, on first use, so bots with agentic AI
+    disabled never load it. RunContext is bound as a module global because
+    the tool annotations below are resolved against this module.
+    """
+    global RunContext
+    from pydantic_ai import Agent, RunContext
+
     agent = Agent(
         "openai:gpt-5-mini",
         deps_type=BotDependencies,
@@ -111,7 +147,7 @@ def _register_core_tools(agent: Agent) -> None:
         result_lines = []
 
         for group_name, commands in grouped.items():
-            if category and category.lower() not in group_name.lower():
+            if category and category.lower() not in group_name:
                 continue
             group_lines = []
             for cmd in commands:
@@ -123,7 +159,7 @@ def _register_core_tools(agent: Agent) -> None:
                 group_lines.append(f"  - {cmd.name}: {cmd.description}")
 
             if group_lines:
-                result_lines.append(f"\n{group_name}:")
+                result_lines.append(f"\n{group_name.title()}:")
                 result_lines.extend(group_lines)
 
         return "\n".join(result_lines) if result_lines else "No commands found"
@@ -181,6 +217,17 @@ def _register_group_tools(agent: Agent) -> None:
         return "Could not get group info"
 
 
+def _used_tools(result) -> bool:
+    """Check whether an agent run called any tools."""
+    from pydantic_ai.messages import ToolCallPart
+
+    return any(
+        isinstance(part, ToolCallPart)
+        for message in result.new_messages()
+        for part in getattr(message, "parts", ())
+    )
+
+
 _bot_agent: Agent | None = None
 
 
@@ -203,6 +250,11 @@ class AgenticAI:
         """Initialize the AI agent and load saved skills."""
         self._skills: dict[str, dict] = {}
         self._bot_ids: list[str] | None = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._skills_block: str | None = None
+        self._bot_name: str | None = None
+        self._bot_name_lc = ""
+        self._installed_key: tuple[str, str] | None = None
         self._load_saved_skills()
 
     def _load_saved_skills(self) -> None:
@@ -266,6 +318,8 @@ class AgenticAI:
             "description": description,
             "trigger": trigger,
         }
+        self._skills_block = None
+        response_cache.clear()
         log_info(f"Added AI skill: {name}")
         return True
 
@@ -273,6 +327,8 @@ class AgenticAI:
         """Remove a skill from the AI."""
         if name in self._skills:
             del self._skills[name]
+            self._skills_block = None
+            response_cache.clear()
             log_info(f"Removed AI skill: {name}")
             return True
         return False
@@ -292,9 +348,32 @@ class AgenticAI:
 
         return instructions
 
+    def _install_api_key(self) -> None:
+        """Export the API key for the provider SDK, only when provider or key changed."""
+        installed = (self.provider, self.api_key)
+        if installed == self._installed_key:
+            return
+        self._installed_key = installed
+
+        provider, key = installed
+        for env_name in PROVIDER_KEY_ENV.get(provider, ()):
+            os.environ[env_name] = key
+
+    def _skills_context(self) -> str:
+        """Get the skills section of the prompt, rebuilt only when skills change."""
+        if self._skills_block is None:
+            block = ""
+            if self._skills:
+                block = "--- SKILLS (Follow these instructions) ---"
+                for name, skill in self._skills.items():
+                    block += f"\n## {name}\n{skill['content']}"
+                block += "\n"
+            self._skills_block = block
+        return self._skills_block
+
     async def _get_bot_ids(self, bot: BotClient) -> list[str]:
-        """Get bot's own JID identifiers (cached)."""
-        if self._bot_ids is not None:
+        """Get bot's own JID identifiers (cached until the next reconnect)."""
+        if self._bot_ids:
             return self._bot_ids
 
         ids = []
@@ -308,63 +387,90 @@ class AgenticAI:
         except Exception:
             pass
 
-        self._bot_ids = ids
+        if ids:
+            self._bot_ids = ids
         return ids
 
-    def _is_mentioned(self, msg: MessageHelper, bot_ids: list[str]) -> bool:
-        """Check if the bot is mentioned in a message (group only)."""
-        if msg.mentions:
-            for mention in msg.mentions:
-                user = mention.split("@")[0] if "@" in mention else mention
-                if user in bot_ids:
-                    return True
+    def clear_bot_ids(self) -> None:
+        """Forget the cached bot identifiers so they are fetched again."""
+        self._bot_ids = None
 
-        text_mentions = re.findall(r"@(\d+)", msg.text or "")
-        return any(m in bot_ids for m in text_mentions)
+    def _is_mentioned(
+        self, msg: MessageHelper, bot_ids: list[str], text: str | None = None
+    ) -> bool:
+        """Check if the bot is mentioned in a message (group only)."""
+        id_set = frozenset(bot_ids)
+        if msg.mentions and not id_set.isdisjoint(m.partition("@")[0] for m in msg.mentions):
+            return True
 
-    async def should_respond(self, msg: MessageHelper, bot: BotClient = None) -> bool:
-        """Check if AI should handle this message based on trigger mode."""
-        if not self.enabled or not self.api_key:
-            return False
+        if text is None:
+            text = msg.text or ""
+        return not id_set.isdisjoint(_MENTION_RE.findall(text))
 
-        if self.owner_only and not await runtime_config.is_owner_async(msg.sender_jid, bot):
-            log_debug(f"AI skipped: {msg.sender_jid} is not owner")
-            return False
+    def _bot_name_lower(self) -> str:
+        """Get the lowercased bot name, recomputed only when the configured name changes."""
+        name = runtime_config.bot_name
+        if name != self._bot_name:
+            self._bot_name = name
+            self._bot_name_lc = name.lower()
+        return self._bot_name_lc
 
+    async def _is_triggered(self, msg: MessageHelper, bot: BotClient | None) -> bool:
+        """Check the trigger mode, doing the cheap text checks before any awaits."""
         mode = self.trigger_mode
 
         if mode == "always":
             return True
 
-        bot_ids = await self._get_bot_ids(bot) if bot else []
-        log_debug(f"AI check: mode={mode}, is_group={msg.is_group}, bot_ids={bot_ids}")
-
         if mode == "mention":
-            bot_name = runtime_config.bot_name.lower()
-            text = (msg.text or "").lower()
-
-            if bot_name and bot_name in text:
-                log_debug(f"AI triggered: bot name '{bot_name}' found in text")
+            # msg.text walks the protobuf on every access, so read it once.
+            text_raw = msg.text or ""
+            bot_name = self._bot_name_lower()
+            if bot_name and bot_name in text_raw.lower():
+                if is_debug_enabled():
+                    log_debug(f"AI triggered: bot name '{bot_name}' found in text")
                 return True
 
-            if msg.is_group and bot_ids:
-                if self._is_mentioned(msg, bot_ids):
-                    log_debug("AI triggered: @mention in group")
-                    return True
+            if not msg.is_group or not bot:
+                return False
+
+            bot_ids = await self._get_bot_ids(bot)
+            if bot_ids and self._is_mentioned(msg, bot_ids, text_raw):
+                log_debug("AI triggered: @mention in group")
+                return True
 
             return False
 
         if mode == "reply":
-            quoted = msg.quoted_message
-            if quoted and bot_ids:
-                if any(msg.is_quoted_from(bid) for bid in bot_ids):
-                    log_debug("AI triggered: reply to bot message")
-                    return True
+            if not bot or msg.quoted_message is None:
+                return False
+
+            bot_ids = await self._get_bot_ids(bot)
+            if any(msg.is_quoted_from(bid) for bid in bot_ids):
+                log_debug("AI triggered: reply to bot message")
+                return True
 
             return False
 
         return False
 
+    async def should_respond(self, msg: MessageHelper, bot: BotClient = None) -> bool:
+        """Check if AI should handle this message based on trigger mode."""
+        if not self.enabled or not self.api_key:
+            return False
+
+        # Most messages never trigger the AI, so settle that before paying
+        # for the owner lookup (which may resolve JIDs over the network).
+        if not await self._is_triggered(msg, bot):
+            return False
+
+        if self.owner_only and not await runtime_config.is_owner_async(msg.sender_jid, bot):
+            if is_debug_enabled():
+                log_debug(f"AI skipped: {msg.sender_jid} is not owner")
+            return False
+
+        return True
+
     async def process(self, msg: MessageHelper, bot: BotClient) -> str | None:
         """
         Process message with Pydantic AI agent.
@@ -376,19 +482,78 @@ class AgenticAI:
         if not self.api_key:
             return None
 
+        message_type = msg._detect_media_type(msg.raw_message) or "text"
+        quoted = msg.quoted_message
+        is_reply = quoted is not None
+        reply_to = quoted.get("text", "") if quoted else None
+        text = msg.text
+
+        cache_key = None
+        cache_parts = None
+        if text and message_type != "image":
+            # Answers depend on the chat history in the prompt, so the key
+            # carries the memory revision they were produced against.
+            memory = get_memory(msg.chat_jid)
+            cache_parts = (
+                normalize_prompt(text),
+                msg.chat_jid,
+                msg.sender_jid,
+                message_type,
+                reply_to if is_reply else None,
+            )
+            cache_key = make_cache_key(*cache_parts, memory.revision)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                log_debug("AI response served from cache")
+                memory.add(
+                    role="user",
+                    content=text,
+                    sender_name=msg.sender_name,
+                    message_type=message_type,
+                    is_reply=is_reply,
+                    reply_to=reply_to,
+                )
+                memory.add(role="assistant", content=cached)
+                response_cache.put(make_cache_key(*cache_parts, memory.revision), cached)
+                return cached
+
+        if cache_key is None:
+            return await self._run(msg, bot, message_type, quoted, None)
+
+        # Identical prompts that arrive while one is still running wait for
+        # that run instead of starting their own.
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            log_debug("AI request joined an identical in-flight request")
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._run(msg, bot, message_type, quoted, cache_parts))
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        msg: MessageHelper,
+        bot: BotClient,
+        message_type: str,
+        quoted: dict | None,
+        cache_parts: tuple | None,
+    ) -> str | None:
+        """Run the agent for a message that was not answered from cache."""
+        from ai.memory import get_memory
+
+        is_reply = quoted is not None
+        reply_to = quoted.get("text", "") if quoted else None
+        text = msg.text
+
         user_id = msg.sender_jid.split("@")[0] if msg.sender_jid else "unknown"
         chat_id = msg.chat_jid
         if not token_tracker.can_use(user_id, chat_id):
             log_info(f"AI token limit reached for user={user_id} chat={chat_id}")
             return "⏳ AI daily limit reached. Try again tomorrow!"
 
-        if self.provider == "openai":
-            os.environ["OPENAI_API_KEY"] = self.api_key
-        elif self.provider == "anthropic":
-            os.environ["ANTHROPIC_API_KEY"] = self.api_key
-        elif self.provider == "google":
-            os.environ["GOOGLE_API_KEY"] = self.api_key
-            os.environ["GEMINI_API_KEY"] = self.api_key
+        self._install_api_key()
 
         model_str = f"{self.provider}:{self.model}"
         log_info(f"AI processing with model: {model_str}")
@@ -401,22 +566,18 @@ class AgenticAI:
         bot_jid = bot_ids[0] if bot_ids else ""
         bot_lid = bot_ids[1] if len(bot_ids) > 1 else ""
 
-        message_type = msg._detect_media_type(msg.raw_message) or "text"
-
         image_data: bytes | None = None
         if message_type == "image":
             try:
                 msg_obj, _ = msg.get_media_message(bot)
                 if msg_obj:
                     image_data = await bot._client.download_any(msg_obj)
-                    log_debug(f"AI vision: downloaded {len(image_data)} bytes")
+                    if is_debug_enabled():
+                        log_debug(f"AI vision: downloaded {len(image_data)} bytes")
             except Exception as e:
                 log_warning(f"AI vision: failed to download image: {e}")
                 image_data = None
 
-        quoted = msg.quoted_message
-        is_reply = quoted is not None
-        reply_to = quoted.get("text", "") if quoted else None
         reply_sender = quoted.get("sender", "").split("@")[0] if quoted else None
 
         quoted_context = ""
@@ -425,37 +586,34 @@ class AgenticAI:
                 f'\n- Quoted message content: "{reply_to}"\n- Quoted message sender: {reply_sender}'
             )
 
-        context_info = f"""
-Current context:
-- Chat: {msg.chat_jid}
-- Sender name: {msg.sender_name}
-- Sender JID for mentioning: {sender_id} (use @{sender_id} with with_mentions=True to mention them)
-- Is group: {msg.is_group}
-- Message type: {message_type}
-- Is reply to another message: {is_reply}{quoted_context}
-- Bot JID: {bot_jid} (this is YOU, the bot)
-- Bot LID: {bot_lid} (this is also YOU, the bot)
-Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not asking you to mention yourself.
-"""
+        # Stable, per-chat details go first and per-message details last, so
+        # consecutive prompts in a chat share the longest possible prefix and
+        # hit the provider's prompt cache.
+        chat_context = CHAT_CONTEXT_TEMPLATE.format(
+            chat=msg.chat_jid, is_group=msg.is_group, bot_jid=bot_jid, bot_lid=bot_lid
+        )
+        message_context = MESSAGE_CONTEXT_TEMPLATE.format(
+            sender_name=msg.sender_name,
+            sender_id=sender_id,
+            message_type=message_type,
+            is_reply=is_reply,
+            quoted_context=quoted_context,
+        )
 
         memory = get_memory(msg.chat_jid)
         history_text = memory.get_context_string()
         if history_text:
-            history_text = "\n\n" + history_text
+            history_text = "\n" + history_text + "\n"
 
         try:
-            skills_context = ""
-            if self._skills:
-                skills_context = "\n\n--- SKILLS (Follow these instructions) ---"
-                for name, skill in self._skills.items():
-                    skills_context += f"\n## {name}\n{skill['content']}"
-
             user_prompt_parts: list = []
 
-            text_content = f"{context_info}{history_text}{skills_context}\n\nUser message: {msg.text or '(image)'}"
+            text_content = f"{self._skills_context()}{chat_context}{history_text}{message_context}\nUser message: {text or '(image)'}"
             user_prompt_parts.append(text_content)
 
             if image_data:
+                from pydantic_ai import BinaryContent
+
                 user_prompt_parts.append(BinaryContent(data=image_data, media_type="image/jpeg"))
 
             result = await get_agent().run(
@@ -464,10 +622,10 @@ Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not
                 model=model_str,
             )
 
-            if msg.text:
+            if text:
                 memory.add(
                     role="user",
-                    content=msg.text,
+                    content=text,
                     sender_name=msg.sender_name,
                     message_type=message_type,
                     is_reply=is_reply,
@@ -475,6 +633,10 @@ Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not
                 )
             if result.output:
                 memory.add(role="assistant", content=result.output)
+                if cache_parts and not _used_tools(result):
+                    # Stored against the history that now ends with this
+                    # exchange; any later message in the chat makes it a miss.
+                    response_cache.put(make_cache_key(*cache_parts, memory.revision), result.output)
 
             try:
                 usage = result.usage()
@@ -484,17 +646,18 @@ Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not
             except Exception:
                 token_tracker.record(user_id, chat_id, 1000)  # estimate
 
-            log_debug(f"AI response: {result.output}")
+            if is_debug_enabled():
+                log_debug(f"AI response: {result.output}")
             return result.output
 
         except Exception as e:
             error_str = str(e)
             if "expected a string, got null" in error_str:
                 log_debug("AI completed tool execution (null response is expected)")
-                if msg.text:
+                if text:
                     memory.add(
                         role="user",
-                        content=msg.text,
+                        content=text,
                         sender_name=msg.sender_name,
                         message_type=message_type,
                         is_reply=is_reply,
@@ -511,6 +674,7 @@ Note: When user mentions @{bot_jid} or @{bot_lid}, they are talking TO you, not
     def set_api_key(self, key: str) -> None:
         """Set the API key."""
         runtime_config.set_nested("agentic_ai", "api_key", key)
+        self._install_api_key()
 
     def set_trigger_mode(self, mode: str) -> None:
         """Set trigger mode (always, mention, reply)."""
@@ -6,6 +6,7 @@ Supports TTL-based eviction to keep memory fresh and bounded.
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Literal
@@ -16,6 +17,10 @@ from core.logger import log_debug, log_error
 MAX_MESSAGES = 100
 DEFAULT_TTL_HOURS = 24
 
+# Revisions come from one process-wide counter so a chat whose memory was
+# cleared and recreated never reuses a revision seen before.
+_revisions = itertools.count(1)
+
 
 @dataclass
 class MemoryEntry:
@@ -47,6 +52,7 @@ class AIMemory:
         self.ttl_hours = ttl_hours
         self._safe_id = chat_id.replace("@", "_").replace(":", "_")
         self._entries: list[MemoryEntry] = []
+        self.revision = next(_revisions)
         self._load()
 
     @property
@@ -88,6 +94,7 @@ class AIMemory:
         evicted = before - len(self._entries)
 
         if evicted > 0:
+            self.revision = next(_revisions)
             self._save()
 
         return evicted
@@ -118,6 +125,7 @@ class AIMemory:
         if len(self._entries) > MAX_MESSAGES * 2:
             self._entries = self._entries[-MAX_MESSAGES * 2 :]
 
+        self.revision = next(_revisions)
         self._save()
 
     def get_history(self, limit: int = MAX_MESSAGES) -> list[MemoryEntry]:
@@ -162,6 +170,7 @@ class AIMemory:
     def clear(self) -> None:
         """Clear all memory for this chat."""
         self._entries = []
+        self.revision = next(_revisions)
         kv_delete(self._scope, self._safe_id)
 
 
@@ -0,0 +1,72 @@
+"""AI response cache.
+
+Reuses answers to repeated plain-chat prompts so the same user sending the same
+message again within a short window does not go back to the model. Only runs
+that did not call any tools are cached, since replaying those would skip the
+action.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+
+RESPONSE_CACHE_TTL = 60.0
+RESPONSE_CACHE_MAX_SIZE = 256
+
+
+def normalize_prompt(text: str) -> str:
+    """Casefold and collapse whitespace so trivially different prompts share a key."""
+    return " ".join(text.casefold().split())
+
+
+def make_cache_key(*parts: object) -> str:
+    """Build a SHA-256 cache key from the given prompt parts."""
+    raw = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Small in-memory LRU of AI responses with a per-entry TTL."""
+
+    def __init__(
+        self, max_size: int = RESPONSE_CACHE_MAX_SIZE, ttl: float = RESPONSE_CACHE_TTL
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response, dropping it if it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, output = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return output
+
+    def put(self, key: str, output: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if not output:
+            return
+
+        self._entries[key] = (time.monotonic(), output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache()
@@ -4,18 +4,9 @@ Help command - Shows all available commands.
 
 from core import symbols as sym
 from core.command import Command, CommandContext, command_loader
+from core.help_utils import category_icon
 from core.i18n import t
 
-CATEGORY_ICONS = {
-    "general": sym.INFO,
-    "admin": sym.USER,
-    "group": sym.GROUP,
-    "owner": sym.SETTINGS,
-    "moderation": sym.WARNING,
-    "content": sym.SPARKLE,
-    "utility": sym.COMMAND,
-}
-
 
 class HelpCommand(Command):
     """
@@ -34,29 +25,22 @@ class HelpCommand(Command):
         """Show help message with all available commands."""
         p = ctx.prefix
 
-        def fmt(name):
-            return f"{p}{name}"
-
         if ctx.args:
             query = ctx.args[0].lower()
             grouped = command_loader.get_grouped_commands()
 
-            matched_category = None
-            for group_name in grouped:
-                if group_name.lower() == query:
-                    matched_category = group_name
-                    break
+            matched_category = query if query in grouped else None
 
             if matched_category:
                 commands = grouped[matched_category]
-                icon = CATEGORY_ICONS.get(matched_category.lower(), sym.DIAMOND)
-                lines = [f"{icon} *{matched_category} Commands*\n"]
+                icon = category_icon(matched_category)
+                lines = [f"{icon} *{matched_category.title()} Commands*\n"]
                 for cmd in commands:
                     aliases_str = ""
                     if cmd.aliases:
-                        aliases_str = f" ({', '.join(f'`{fmt(a)}`' for a in cmd.aliases)})"
+                        aliases_str = f" ({', '.join(f'`{p}{a}`' for a in cmd.aliases)})"
                     lines.append(
-                        f"  {sym.BULLET} `{fmt(cmd.name)}`{aliases_str} {sym.ARROW} {cmd.description}"
+                        f"  {sym.BULLET} `{p}{cmd.name}`{aliases_str} {sym.ARROW} {cmd.description}"
                     )
 
                     cooldown = getattr(cmd, "cooldown", 0)
@@ -73,15 +57,15 @@ class HelpCommand(Command):
             cmd = command_loader.get(command_name)
 
             if cmd and cmd.enabled:
-                icon = CATEGORY_ICONS.get(getattr(cmd, "category", "").lower(), sym.DIAMOND)
+                icon = category_icon(getattr(cmd, "category", ""))
                 help_text = (
-                    f"{sym.HEADER_L} {fmt(cmd.name)} {sym.HEADER_R}\n\n"
+                    f"{sym.HEADER_L} {p}{cmd.name} {sym.HEADER_R}\n\n"
                     f"{sym.QUOTE} {cmd.description}\n\n"
                     f"{sym.BULLET} *{t('help.usage')}:* `{cmd.get_usage(p)}`\n"
                 )
 
                 if cmd.aliases:
-                    aliases_str = ", ".join(f"`{fmt(a)}`" for a in cmd.aliases)
+                    aliases_str = ", ".join(f"`{p}{a}`" for a in cmd.aliases)
                     help_text += f"{sym.BULLET} *{t('help.aliases')}:* {aliases_str}\n"
 
                 category_name = getattr(cmd, "category", None)
@@ -116,7 +100,7 @@ class HelpCommand(Command):
             else:
                 similar = command_loader.find_similar(command_name)
                 if similar:
-                    suggestions = ", ".join(f"`{fmt(s)}`" for s in similar)
+                    suggestions = ", ".join(f"`{p}{s}`" for s in similar)
                     help_text = (
                         f"{sym.SEARCH} {t('help.not_found', command=command_name)}\n\n"
                         f"{sym.ARROW} *{t('help.did_you_mean')}:* {suggestions}"
@@ -132,12 +116,12 @@ class HelpCommand(Command):
         lines = [f"{sym.STAR} *{t('help.available_commands')}*\n"]
 
         for group_name, commands in grouped.items():
-            icon = CATEGORY_ICONS.get(group_name.lower(), sym.DIAMOND)
-            lines.append(f"\n{icon} *{group_name}*")
+            icon = category_icon(group_name)
+            lines.append(f"\n{icon} *{group_name.title()}*")
             for cmd in commands:
-                lines.append(f"  {sym.BULLET} `{fmt(cmd.name)}` {sym.ARROW} {cmd.description}")
+                lines.append(f"  {sym.BULLET} `{p}{cmd.name}` {sym.ARROW} {cmd.description}")
 
         lines.append(f"\n{sym.INFO} {t('help.type_help', prefix=p)}")
-        lines.append(f"{sym.INFO} Use `{fmt('help')} <category>` for category details")
+        lines.append(f"{sym.INFO} Use `{p}help <category>` for category details")
 
         await ctx.client.reply(ctx.message, "\n".join(lines))
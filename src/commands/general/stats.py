@@ -10,6 +10,9 @@ from core.command import Command, CommandContext, command_loader
 from core.i18n import t
 from core.storage import Storage
 
+_PLATFORM = f"{platform.system()} {platform.machine()}"
+_PYTHON_VERSION = platform.python_version()
+
 
 class StatsCommand(Command):
     name = "stats"
@@ -57,8 +60,8 @@ class StatsCommand(Command):
             sym.status_line(t("stats.commands_used"), str(commands)),
             sym.status_line(t("stats.commands_loaded"), str(total_cmds)),
             sym.status_line(t("stats.groups"), str(group_count)),
-            sym.status_line(t("stats.platform"), f"{platform.system()} {platform.machine()}"),
-            sym.status_line(t("stats.python"), platform.python_version()),
+            sym.status_line(t("stats.platform"), _PLATFORM),
+            sym.status_line(t("stats.python"), _PYTHON_VERSION),
         ]
 
         await ctx.client.reply(ctx.message, "\n".join(lines))
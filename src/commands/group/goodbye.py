@@ -4,6 +4,7 @@ Goodbye command - Configure goodbye messages for leaving members.
 
 from core.command import Command, CommandContext
 from core.handlers.welcome import (
+    PLACEHOLDERS_HELP,
     get_goodbye_config,
     handle_welcome_goodbye_config,
     set_goodbye_config,
@@ -27,19 +28,10 @@ class GoodbyeCommand(Command):
 
     async def execute(self, ctx: CommandContext) -> None:
         """Configure goodbye messages."""
-        placeholders_help = (
-            "• `{name}` - Member's name\n"
-            "• `{mention}` - @mention the member\n"
-            "• `{group}` - Group name\n"
-            "• `{count}` - Member count\n"
-            "• `{date}` - Current date\n"
-            "• `{time}` - Current time"
-        )
-
         await handle_welcome_goodbye_config(
             ctx,
             "goodbye",
             get_goodbye_config,
             set_goodbye_config,
-            placeholders_help,
+            PLACEHOLDERS_HELP,
         )
@@ -5,7 +5,30 @@ Groupinfo command - Show group information.
 from datetime import datetime
 
 from core.command import Command, CommandContext
-from core.i18n import t, t_error
+from core.i18n import get_language, t, t_error
+
+_info_templates: dict[str, str] = {}
+
+
+def _info_template() -> str:
+    """Return the groupinfo body template for the current language, building it once."""
+    lang = get_language()
+    template = _info_templates.get(lang)
+    if template is None:
+
+        def label(key: str) -> str:
+            return t(key).replace("{", "{{").replace("}", "}}")
+
+        template = (
+            "*{name}*\n\n"
+            f"*{label('group.description')}:*\n{{topic}}\n\n"
+            f"*{label('group.owner')}:* @{{owner}}\n"
+            f"*{label('group.created')}:* {{created}}\n\n"
+            f"*{label('group.members')}:* {{total}}\n"
+            f"*{label('group.admins')}:* {{admins}}"
+        )
+        _info_templates[lang] = template
+    return template
 
 
 class GroupinfoCommand(Command):
@@ -22,16 +45,18 @@ class GroupinfoCommand(Command):
         try:
             group_info = await ctx.client._client.get_group_info(ctx.client.to_jid(group_jid))
 
+            present = {fd.name for fd, _ in group_info.ListFields()}
+
             name = t("common.unknown")
-            if group_info.HasField("GroupName") and group_info.GroupName.Name:
+            if "GroupName" in present and group_info.GroupName.Name:
                 name = group_info.GroupName.Name
 
             topic = t("group.no_description")
-            if group_info.HasField("GroupTopic") and group_info.GroupTopic.Topic:
+            if "GroupTopic" in present and group_info.GroupTopic.Topic:
                 topic = group_info.GroupTopic.Topic
 
             owner = t("common.unknown")
-            if group_info.HasField("OwnerJID") and group_info.OwnerJID.User:
+            if "OwnerJID" in present and group_info.OwnerJID.User:
                 owner = group_info.OwnerJID.User
 
             created = t("common.unknown")
@@ -39,28 +64,31 @@ class GroupinfoCommand(Command):
                 created_dt = datetime.fromtimestamp(group_info.GroupCreated)
                 created = created_dt.strftime("%Y-%m-%d %H:%M")
 
-            total = len(group_info.Participants) if group_info.Participants else 0
-            admins = sum(1 for p in (group_info.Participants or []) if p.IsAdmin or p.IsSuperAdmin)
+            participants = group_info.Participants or []
+            total = len(participants)
+            admins = 0
+            for p in participants:
+                if p.IsAdmin or p.IsSuperAdmin:
+                    admins += 1
 
             is_locked = False
-            if group_info.HasField("GroupLocked"):
+            if "GroupLocked" in present:
                 is_locked = group_info.GroupLocked.isLocked
 
             is_announcement = False
-            if group_info.HasField("GroupAnnounce"):
+            if "GroupAnnounce" in present:
                 is_announcement = group_info.GroupAnnounce.IsAnnounce
 
-            info_lines = [
-                f"*{name}*",
-                "",
-                f"*{t('group.description')}:*\n{topic}",
-                "",
-                f"*{t('group.owner')}:* @{owner}",
-                f"*{t('group.created')}:* {created}",
-                "",
-                f"*{t('group.members')}:* {total}",
-                f"*{t('group.admins')}:* {admins}",
-            ]
+            text = _info_template().format_map(
+                {
+                    "name": name,
+                    "topic": topic,
+                    "owner": owner,
+                    "created": created,
+                    "total": total,
+                    "admins": admins,
+                }
+            )
 
             settings = []
             if is_locked:
@@ -69,9 +97,9 @@ class GroupinfoCommand(Command):
                 settings.append(t("group.announcement_only"))
 
             if settings:
-                info_lines.append(f"*{t('headers.settings')}:* {', '.join(settings)}")
+                text += f"\n*{t('headers.settings')}:* {', '.join(settings)}"
 
-            await ctx.client.reply(ctx.message, "\n".join(info_lines), mentions_are_lids=True)
+            await ctx.client.reply(ctx.message, text, mentions_are_lids=True)
 
         except Exception as e:
             await ctx.client.reply(ctx.message, t_error("group.info_failed", error=str(e)))
@@ -4,6 +4,7 @@ Welcome command - Configure welcome messages for new members.
 
 from core.command import Command, CommandContext
 from core.handlers.welcome import (
+    PLACEHOLDERS_HELP,
     get_welcome_config,
     handle_welcome_goodbye_config,
     set_welcome_config,
@@ -26,19 +27,10 @@ class WelcomeCommand(Command):
 
     async def execute(self, ctx: CommandContext) -> None:
         """Configure welcome messages."""
-        placeholders_help = (
-            "• `{name}` - Member's name\n"
-            "• `{mention}` - @mention the member\n"
-            "• `{group}` - Group name\n"
-            "• `{count}` - Member count\n"
-            "• `{date}` - Current date\n"
-            "• `{time}` - Current time"
-        )
-
         await handle_welcome_goodbye_config(
             ctx,
             "welcome",
             get_welcome_config,
             set_welcome_config,
-            placeholders_help,
+            PLACEHOLDERS_HELP,
         )
@@ -6,7 +6,7 @@ from config.settings import features
 from core import symbols as sym
 from core.command import Command, CommandContext
 from core.i18n import t, t_error, t_info, t_success
-from core.storage import GroupData
+from core.storage import get_group_data
 
 
 class BlacklistCommand(Command):
@@ -23,45 +23,45 @@ class BlacklistCommand(Command):
             await ctx.client.reply(ctx.message, t_error("common.feature_disabled"))
             return
 
-        group_jid = ctx.message.chat_jid
-        data = GroupData(group_jid)
-        words = data.blacklist
+        data = get_group_data(ctx.message.chat_jid)
 
-        if not ctx.args or ctx.args[0].lower() == "list":
+        if not ctx.args or ctx.args[0].casefold() == "list":
+            words = data.blacklist
             if not words:
                 await ctx.client.reply(ctx.message, t_info("blacklist.no_words"))
                 return
 
             await ctx.client.reply(
-                ctx.message, sym.section(t("headers.list"), [f"`{w}`" for w in words])
+                ctx.message, sym.section(t("headers.list"), (f"`{w}`" for w in sorted(words)))
             )
             return
 
-        action = ctx.args[0].lower()
+        action = ctx.args[0].casefold()
 
         if action in ("add", "remove", "rm", "delete", "del"):
             if len(ctx.args) < 2:
                 await ctx.client.reply(ctx.message, t_error("blacklist.no_word"))
                 return
-            word = ctx.args[1].lower()
+            word = ctx.args[1].casefold()
         else:
             action = "add"
-            word = ctx.args[0].lower()
+            word = ctx.args[0].casefold()
 
         if action == "add":
-            if word in words:
+            if word in data.blacklist_casefolded:
                 await ctx.client.reply(ctx.message, t_error("blacklist.exists", word=word))
                 return
 
-            words.append(word)
-            data.save_blacklist(words)
+            words = data.blacklist
+            words.add(word)
+            await data.save_blacklist_async(words)
             await ctx.client.reply(ctx.message, t_success("blacklist.added", word=word))
 
         elif action in ("remove", "rm", "delete", "del"):
-            if word not in words:
+            if word not in data.blacklist_casefolded:
                 await ctx.client.reply(ctx.message, t_error("blacklist.not_found", word=word))
                 return
 
-            words.remove(word)
-            data.save_blacklist(words)
+            words = {w for w in data.blacklist if w.casefold() != word}
+            await data.save_blacklist_async(words)
             await ctx.client.reply(ctx.message, t_success("blacklist.removed", word=word))
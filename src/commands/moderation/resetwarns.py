@@ -3,8 +3,8 @@ Reset warnings command - Clear all warnings for a user.
 """
 
 from core.command import Command, CommandContext
-from core.i18n import t_error, t_success
-from core.storage import GroupData
+from core.i18n import t_error, t_info, t_success
+from core.storage import get_group_data
 from core.targets import parse_single_target
 
 
@@ -22,14 +22,17 @@ class ResetWarnsCommand(Command):
             await ctx.client.reply(ctx.message, t_error("errors.no_target"))
             return
 
-        user_id = target_jid.split("@")[0]
+        user_id = target_jid.partition("@")[0]
         group_jid = ctx.message.chat_jid
 
-        data = GroupData(group_jid)
+        data = get_group_data(group_jid)
         warnings = data.warnings
 
-        if user_id in warnings:
-            del warnings[user_id]
-            data.save_warnings(warnings)
+        if not warnings.get(user_id):
+            await ctx.client.reply(ctx.message, t_info("warn.no_warns", user=user_id))
+            return
+
+        del warnings[user_id]
+        await data.save_warnings_async(warnings)
 
         await ctx.client.reply(ctx.message, t_success("warn.cleared", user=user_id))
@@ -6,7 +6,7 @@ from core import symbols as sym
 from core.command import Command, CommandContext
 from core.i18n import t, t_error, t_success
 from core.permissions import check_admin_permission, check_bot_admin
-from core.storage import GroupData
+from core.storage import GroupData, get_group_data
 from core.targets import extract_reason, parse_single_target
 
 
@@ -21,52 +21,55 @@ class WarnCommand(Command):
         """Warn a user."""
         group_jid = ctx.message.chat_jid
 
-        data = GroupData(group_jid)
-        warn_config = data.warnings_config
-        warn_limit = warn_config.get("limit", 3)
-        warn_action = str(warn_config.get("action", "kick")).lower()
-        if warn_action != "kick":
-            warn_action = "kick"
-
         target_jid = parse_single_target(ctx)
-        reason = extract_reason(ctx, skip_first=not ctx.message.mentions) or t("warn.no_reason")
-
         if not target_jid:
             await ctx.client.reply(ctx.message, t_error("errors.no_target"))
             return
 
-        user_id = target_jid.split("@")[0]
-
-        warnings = data.warnings
-
-        if user_id not in warnings:
-            warnings[user_id] = []
+        reason = extract_reason(ctx, skip_first=not ctx.message.mentions) or t("warn.no_reason")
 
-        warnings[user_id].append(reason)
-        data.save_warnings(warnings)
+        data = get_group_data(group_jid)
+        warn_config = data.warnings_config
+        warn_limit = warn_config.get("limit", 3)
+        warn_action = str(warn_config.get("action", "kick")).lower()
+        if warn_action != "kick":
+            warn_action = "kick"
 
-        warn_count = len(warnings[user_id])
+        user_id = target_jid.partition("@")[0]
 
-        msg = (
-            t("warn.warned", user=user_id, count=warn_count, limit=warn_limit)
-            + f"\n{t('warn.reason')}: {reason}"
-        )
+        warnings = data.warnings
 
-        if warn_count >= warn_limit:
-            if warn_action == "kick" and await check_bot_admin(ctx.client, group_jid):
-                try:
-                    await ctx.client._client.update_group_participants(
-                        ctx.client.to_jid(group_jid),
-                        [ctx.client.to_jid(target_jid)],
-                        "remove",
-                    )
-                    msg += f"\n\n{t('warn.limit_reached', action=warn_action)}"
-                    warnings[user_id] = []
-                    data.save_warnings(warnings)
-                except Exception as e:
-                    msg += f"\n\n{t('warn.action_failed', action=warn_action, error=str(e))}"
-            else:
-                msg += f"\n\n{t('warn.not_admin', action=warn_action)}"
+        user_warnings = warnings.setdefault(user_id, [])
+        user_warnings.append(reason)
+
+        warn_count = len(user_warnings)
+        # Concurrent warns in this group build on the cached count; the
+        # database is written once, after any limit kick.
+        data.stage_warnings(warnings)
+
+        msg = t("warn.warned_full", user=user_id, count=warn_count, limit=warn_limit, reason=reason)
+
+        kicked = False
+        try:
+            if warn_count >= warn_limit:
+                if warn_action == "kick" and await check_bot_admin(ctx.client, group_jid):
+                    try:
+                        await ctx.client._client.update_group_participants(
+                            ctx.client.to_jid(group_jid),
+                            [ctx.client.to_jid(target_jid)],
+                            "remove",
+                        )
+                        msg += f"\n\n{t('warn.limit_reached', action=warn_action)}"
+                        kicked = True
+                    except Exception as e:
+                        msg += f"\n\n{t('warn.action_failed', action=warn_action, error=str(e))}"
+                else:
+                    msg += f"\n\n{t('warn.not_admin', action=warn_action)}"
+        finally:
+            warnings = data.warnings
+            if kicked:
+                warnings[user_id] = []
+            await data.save_warnings_async(warnings)
 
         await ctx.client.reply(ctx.message, msg)
 
@@ -89,7 +92,7 @@ class WarnConfigCommand(Command):
             await ctx.client.reply(ctx.message, t_error("errors.admin_required"))
             return
 
-        data = GroupData(group_jid)
+        data = get_group_data(group_jid)
         args = ctx.args
 
         if not args:
@@ -105,12 +108,12 @@ class WarnConfigCommand(Command):
         elif action in ("on", "enable"):
             config = data.warnings_config
             config["enabled"] = True
-            data.save_warnings_config(config)
+            data.save_warnings_config_deferred(config)
             await ctx.client.reply(ctx.message, t_success("warn.enabled"))
         elif action in ("off", "disable"):
             config = data.warnings_config
             config["enabled"] = False
-            data.save_warnings_config(config)
+            data.save_warnings_config_deferred(config)
             await ctx.client.reply(ctx.message, t_error("warn.disabled"))
         else:
             await self._show_status(ctx, data)
@@ -146,7 +149,7 @@ class WarnConfigCommand(Command):
 
         config = data.warnings_config
         config["limit"] = limit
-        data.save_warnings_config(config)
+        data.save_warnings_config_deferred(config)
         await ctx.client.reply(ctx.message, t_success("warn.limit_set", limit=limit))
 
     async def _set_action(self, ctx: CommandContext, data: GroupData, args: list[str]) -> None:
@@ -174,5 +177,5 @@ class WarnConfigCommand(Command):
         action = requested_action
         config = data.warnings_config
         config["action"] = action
-        data.save_warnings_config(config)
+        data.save_warnings_config_deferred(config)
         await ctx.client.reply(ctx.message, t_success("warn.action_set", action=action))
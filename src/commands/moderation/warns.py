@@ -5,7 +5,7 @@ Warns command - Check warnings for a user.
 from core import symbols as sym
 from core.command import Command, CommandContext
 from core.i18n import t
-from core.storage import GroupData
+from core.storage import get_group_data
 from core.targets import parse_single_target
 
 
@@ -21,10 +21,10 @@ class WarnsCommand(Command):
         if not target_jid:
             target_jid = ctx.message.sender_jid
 
-        user_id = target_jid.split("@")[0]
+        user_id = target_jid.partition("@")[0]
         group_jid = ctx.message.chat_jid
 
-        data = GroupData(group_jid)
+        data = get_group_data(group_jid)
         warnings = data.warnings
         user_warns = warnings.get(user_id, [])
 
@@ -32,7 +32,7 @@ class WarnsCommand(Command):
             await ctx.client.reply(ctx.message, t("warn.no_warns", user=user_id))
             return
 
-        items = [f"{i}. {reason}" for i, reason in enumerate(user_warns, 1)]
+        items = (f"{i}. {reason}" for i, reason in enumerate(user_warns, 1))
         await ctx.client.reply(
             ctx.message,
             sym.section(t("warn.warns_title", user=user_id, count=len(user_warns)), items),
@@ -267,14 +267,7 @@ class DeleteCommandCommand(Command):
             return
 
         try:
-            if cmd_name in command_loader._commands:
-                cmd = command_loader._commands[cmd_name]
-                keys_to_remove = [cmd_name]
-                if hasattr(cmd, "aliases"):
-                    keys_to_remove.extend(cmd.aliases)
-
-                for key in keys_to_remove:
-                    command_loader._commands.pop(key.lower(), None)
+            command_loader.unregister(cmd_name)
 
             file_path.unlink()
 
@@ -5,6 +5,23 @@ Add skill command - Add AI skills from URL or file.
 from core import symbols as sym
 from core.command import Command, CommandContext
 
+_USAGE_HELP = (
+    f"{sym.INFO} *Add AI Skill*\n\n"
+    "Usage:\n"
+    "• `/addskill <url>` - Load from URL\n"
+    "• Attach a `.md` file and send `/addskill`\n\n"
+    "*Skill Format:*\n"
+    "```\n"
+    "---\n"
+    "name: skill_name\n"
+    "description: What this skill does\n"
+    "trigger: always\n"
+    "---\n\n"
+    "# Instructions\n"
+    "Your AI instructions here...\n"
+    "```"
+)
+
 
 class AddSkillCommand(Command):
     name = "addskill"
@@ -83,20 +100,4 @@ class AddSkillCommand(Command):
                 )
                 return
 
-        await ctx.client.reply(
-            ctx.message,
-            f"{sym.INFO} *Add AI Skill*\n\n"
-            f"Usage:\n"
-            f"• `/addskill <url>` - Load from URL\n"
-            f"• Attach a `.md` file and send `/addskill`\n\n"
-            f"*Skill Format:*\n"
-            f"```\n"
-            f"---\n"
-            f"name: skill_name\n"
-            f"description: What this skill does\n"
-            f"trigger: always\n"
-            f"---\n\n"
-            f"# Instructions\n"
-            f"Your AI instructions here...\n"
-            f"```",
-        )
+        await ctx.client.reply(ctx.message, _USAGE_HELP)
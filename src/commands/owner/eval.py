@@ -5,64 +5,153 @@ Eval command - Execute Python code sent by owner.
 This command can execute arbitrary Python code.
 """
 
+import ast
+import inspect
 import io
+import re
+import textwrap
 import traceback
-from contextlib import redirect_stderr, redirect_stdout
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import lru_cache
+from types import CodeType
 
 from core.command import Command, CommandContext
 from core.i18n import t, t_error, t_success
 
+_CODE_FENCE = re.compile(r"```(?:python\n|py\n)?(.*)```", re.DOTALL)
+
 
 def _strip_code_block(code: str) -> str:
     """Strip markdown code block fences from code."""
-    if code.startswith("```") and code.endswith("```"):
-        code = code[3:-3]
-        if code.startswith("python\n"):
-            code = code[7:]
-        elif code.startswith("py\n"):
-            code = code[3:]
-    return code
+    match = _CODE_FENCE.fullmatch(code)
+    return match.group(1) if match else code
+
+
+@lru_cache(maxsize=128)
+def _compile(code: str, is_async: bool = False) -> tuple[CodeType, bool]:
+    """
+    Compile eval source once per (code, is_async), preferring expression mode.
+
+    Returns the code object and whether it is an expression whose value
+    should be reported. The whole resolution is cached, so statements do not
+    fail an expression parse again on repeat. Async bodies may use top-level
+    await; bodies that use `return` are not valid at module level, so those
+    fall back to being wrapped in a coroutine function.
+    """
+    flags = ast.PyCF_ALLOW_TOP_LEVEL_AWAIT if is_async else 0
+    try:
+        return compile(code, "<eval>", "eval", flags=flags), True
+    except SyntaxError:
+        if not is_async:
+            return compile(code, "<exec>", "exec"), False
+    try:
+        return compile(code, "<aeval>", "exec", flags=flags), False
+    except SyntaxError:
+        pass
+
+    wrapped = f"async def __aeval_func__():\n{textwrap.indent(code, '    ')}\n    return None"
+    return compile(wrapped, "<aeval>", "exec"), False
+
+
+_MODULE_GLOBALS = globals()
+
+
+class _EvalEnv(dict):
+    """Eval namespace that falls back to this module's globals without copying them."""
+
+    def __missing__(self, key: str):
+        return _MODULE_GLOBALS[key]
+
+
+_sessions: dict[str, _EvalEnv] = {}
 
 
 def _build_env(ctx: CommandContext) -> dict:
-    """Build the execution environment for eval."""
-    env = {
-        "ctx": ctx,
-        "bot": ctx.client,
-        "msg": ctx.message,
-        "message": ctx.message,
-        "client": ctx.client,
-        "raw": ctx.client.raw,
-    }
-    env.update(globals())
+    """
+    Get the execution environment for eval.
+
+    Each sender keeps one namespace across evals, so names assigned in one
+    eval stay available in the next; only the context bindings are refreshed.
+    """
+    env = _sessions.get(ctx.message.sender_jid)
+    if env is None:
+        env = _sessions[ctx.message.sender_jid] = _EvalEnv()
+    env["ctx"] = ctx
+    env["bot"] = env["client"] = ctx.client
+    env["msg"] = env["message"] = ctx.message
+    env["raw"] = ctx.client.raw
     return env
 
 
-def _format_output(stdout: io.StringIO, stderr: io.StringIO, result) -> str | None:
-    """Format eval output into a reply message."""
-    parts = []
+_OUTPUT_LIMIT = 1000
+_ERROR_LIMIT = 1500
+_TRACEBACK_DEPTH = 50
+
+
+class _CappedWriter(io.TextIOBase):
+    """Text sink that keeps only the first `cap` characters written to it."""
+
+    def __init__(self, cap: int = _OUTPUT_LIMIT):
+        super().__init__()
+        self._buf: list[str] = []
+        self._remaining = cap
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if self._remaining > 0 and s:
+            chunk = s[: self._remaining]
+            self._buf.append(chunk)
+            self._remaining -= len(chunk)
+        return len(s)
 
-    stdout_val = stdout.getvalue()
-    stderr_val = stderr.getvalue()
+    @property
+    def full(self) -> bool:
+        return self._remaining <= 0
 
-    if stdout_val:
-        parts.append(f"*stdout:*\n```\n{stdout_val[:1000]}```")
-    if stderr_val:
-        parts.append(f"*stderr:*\n```\n{stderr_val[:1000]}```")
+    def getvalue(self) -> str:
+        return "".join(self._buf)
+
+
+@contextmanager
+def _capture() -> Iterator[tuple[_CappedWriter, _CappedWriter]]:
+    """Redirect stdout and stderr into capped buffers for the duration of an eval."""
+    stdout = _CappedWriter()
+    stderr = _CappedWriter()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        yield stdout, stderr
+
+
+def _format_output(stdout: _CappedWriter, stderr: _CappedWriter, result) -> str | None:
+    """Format eval output into a reply message."""
+    out = stdout.getvalue()
+    err = stderr.getvalue()
+    text = (f"*stdout:*\n```\n{out}```\n\n" if out else "") + (
+        f"*stderr:*\n```\n{err}```\n\n" if err else ""
+    )
     if result is not None:
         result_str = repr(result)
-        if len(result_str) > 1000:
-            result_str = result_str[:1000] + "..."
-        parts.append(f"*{t('eval.result')}:*\n```\n{result_str}```")
-
-    return "\n\n".join(parts) if parts else None
+        if len(result_str) > _OUTPUT_LIMIT:
+            result_str = result_str[:_OUTPUT_LIMIT] + "..."
+        text += f"*{t('eval.result')}:*\n```\n{result_str}```\n\n"
+    return text[:-2] if text else None
 
 
 def _format_error(e: Exception) -> str:
-    """Format an exception into an error reply."""
-    error_msg = "".join(traceback.format_exception(type(e), e, e.__traceback__))
-    if len(error_msg) > 1500:
-        error_msg = error_msg[:1500] + "..."
+    """Format an exception into an error reply, stopping once the size cap is hit."""
+    lines = traceback.TracebackException(
+        type(e), e, e.__traceback__, limit=_TRACEBACK_DEPTH
+    ).format()
+    buffer = _CappedWriter(_ERROR_LIMIT + 1)
+    for line in lines:
+        buffer.write(line)
+        if buffer.full:
+            break
+    error_msg = buffer.getvalue()
+    if len(error_msg) > _ERROR_LIMIT:
+        error_msg = error_msg[:_ERROR_LIMIT] + "..."
     return f"❌ *{t('eval.error')}:*\n```\n{error_msg}```"
 
 
@@ -82,15 +171,14 @@ class EvalCommand(Command):
 
         code = _strip_code_block(ctx.raw_args)
         env = _build_env(ctx)
-        stdout = io.StringIO()
-        stderr = io.StringIO()
 
         try:
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                try:
-                    result = eval(code, env)
-                except SyntaxError:
-                    exec(code, env)
+            with _capture() as (stdout, stderr):
+                compiled, is_expression = _compile(code)
+                if is_expression:
+                    result = eval(compiled, env)
+                else:
+                    exec(compiled, env)
                     result = None
 
             output = _format_output(stdout, stderr, result)
@@ -115,18 +203,17 @@ class AsyncEvalCommand(Command):
 
         code = _strip_code_block(ctx.raw_args)
         env = _build_env(ctx)
-        stdout = io.StringIO()
-        stderr = io.StringIO()
 
         try:
-            wrapped = "async def __aeval_func__():\n"
-            for line in code.split("\n"):
-                wrapped += f"    {line}\n"
-            wrapped += "    return None"
-
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                exec(wrapped, env)
-                result = await env["__aeval_func__"]()
+            compiled, is_expression = _compile(code, is_async=True)
+
+            with _capture() as (stdout, stderr):
+                result = eval(compiled, env)
+                if compiled.co_flags & inspect.CO_COROUTINE:
+                    result = await result
+                if not is_expression:
+                    func = env.pop("__aeval_func__", None)
+                    result = await func() if func else None
 
             output = _format_output(stdout, stderr, result)
             await ctx.client.reply(ctx.message, output or t_success("eval.no_output"))
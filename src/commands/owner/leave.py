@@ -25,31 +25,34 @@ class LeaveCommand(Command):
         - Owner: can leave current group or target a specific group by JID.
         - Group admin: can make the bot leave the current group.
         """
-        is_owner = await runtime_config.is_owner_async(ctx.message.sender_jid)
-        is_group = ctx.message.is_group
-
         args = ctx.args
+        is_owner = None
 
-        if is_owner and args:
-            target_jid = args[0]
-            if not target_jid.endswith("@g.us"):
-                target_jid = f"{target_jid}@g.us"
-            try:
-                await ctx.client.leave_group(target_jid)
-                await ctx.client.reply(ctx.message, t_success("leave.left", group=target_jid))
-            except Exception as e:
-                await ctx.client.reply(ctx.message, t_error("leave.failed", error=str(e)))
-            return
+        if args:
+            is_owner = await runtime_config.is_owner_async(ctx.message.sender_jid)
+            if is_owner:
+                target_jid = args[0]
+                if not target_jid.endswith("@g.us"):
+                    target_jid = f"{target_jid}@g.us"
+                try:
+                    await ctx.client.leave_group(target_jid)
+                    await ctx.client.reply(ctx.message, t_success("leave.left", group=target_jid))
+                except Exception as e:
+                    await ctx.client.reply(ctx.message, t_error("leave.failed", error=str(e)))
+                return
 
-        if not is_group:
+        if not ctx.message.is_group:
             await ctx.client.reply(ctx.message, t_error("leave.not_group"))
             return
 
-        if not is_owner:
-            is_admin = await check_admin_permission(
-                ctx.client, ctx.message.chat_jid, ctx.message.sender_jid
-            )
-            if not is_admin:
+        # Admins are the common caller here, so only resolve the owner when
+        # the (cached) admin check fails.
+        if not await check_admin_permission(
+            ctx.client, ctx.message.chat_jid, ctx.message.sender_jid
+        ):
+            if is_owner is None:
+                is_owner = await runtime_config.is_owner_async(ctx.message.sender_jid)
+            if not is_owner:
                 await ctx.client.reply(ctx.message, t_error("leave.no_permission"))
                 return
 
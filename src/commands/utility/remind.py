@@ -16,13 +16,15 @@ from datetime import datetime
 from core.command import Command, CommandContext
 from core.i18n import t, t_error, t_info, t_success
 from core.media import get_media_caption
-from core.scheduler import get_scheduler
+from core.scheduler import TaskType, get_scheduler
 from core.utils import format_duration, parse_duration
 
 
 def format_datetime(dt: datetime) -> str:
-    """Format datetime for display."""
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    """Format datetime for display as YYYY-MM-DD HH:MM:SS."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
 
 
 class RemindCommand(Command):
@@ -50,8 +52,9 @@ class RemindCommand(Command):
         action = ctx.args[0].lower()
 
         if action == "list":
-            tasks = scheduler.get_tasks_for_chat(ctx.message.chat_jid)
-            reminders = [t for t in tasks if t.task_type == "reminder"]
+            reminders = scheduler.get_tasks_for_chat(
+                ctx.message.chat_jid, task_type=TaskType.REMINDER
+            )
 
             if not reminders:
                 await ctx.client.reply(ctx.message, t("remind.no_reminders"))
@@ -111,18 +114,13 @@ class RemindCommand(Command):
         sender_id = ctx.message.sender_jid.split("@")[0]
         is_group = ctx.message.is_group
 
-        media_labels = {
-            "image": t("remind.media_image"),
-            "video": t("remind.media_video"),
-            "sticker": t("remind.media_sticker"),
-            "document": t("remind.media_document"),
-            "audio": t("remind.media_audio"),
-        }
-
         if message:
             reminder_text = f"⏰ *{t('remind.reminder')}*\n\n{message}"
         elif media_type:
-            label = media_labels.get(media_type, media_type)
+            label_key = f"remind.media_{media_type}"
+            label = t(label_key)
+            if label == label_key:
+                label = media_type
             reminder_text = f"⏰ *{t('remind.reminder')}*\n\n_{label} {t('remind.attached')}_"
         elif forward_msg:
             reminder_text = f"⏰ *{t('remind.reminder')}*\n\n_{t('remind.message_attached')}_"
@@ -5,14 +5,28 @@ Tracks per-command usage with timestamps for dashboard charts.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import time
 from datetime import datetime, timedelta
 
-from core.db import kv_get_json, kv_set_json
-from core.logger import log_debug
+from core.db import (
+    count_command_events,
+    count_command_events_by_day,
+    delete_command_events_before,
+    event_day,
+    insert_command_events,
+    kv_delete,
+    kv_get_json,
+    total_command_events,
+)
+from core.logger import log_debug, log_error, log_info
 
 DEFAULT_RETENTION_DAYS = 30
-SAVE_INTERVAL_SECONDS = 2.0
+SAVE_INTERVAL_SECONDS = 5.0
+SAVE_BATCH_SIZE = 100
+MAX_PENDING_EVENTS = 10_000
+PRUNE_INTERVAL_SECONDS = 3600.0
 
 
 class CommandAnalytics:
@@ -21,89 +35,125 @@ class CommandAnalytics:
     def __init__(self):
         self._scope = "analytics"
         self._key = "payload"
-        self._data: dict = {}
-        self._dirty = False
+        self._pending: list[dict] = []
         self._last_save_ts = 0.0
+        self._save_failed = False
+        self._last_prune_ts = 0.0
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._load()
 
     def _load(self) -> None:
-        """Load analytics data from database."""
-        data = kv_get_json(self._scope, self._key, default={})
-        self._data = data if isinstance(data, dict) else {}
-        if "commands" not in self._data:
-            self._data["commands"] = {}
+        """Move analytics from the legacy key-value payload into the events table."""
+        data = kv_get_json(self._scope, self._key, default=None)
+        if not isinstance(data, dict):
+            return
+
+        events = []
+        for name, entries in data.get("commands", {}).items():
+            for entry in entries:
+                try:
+                    ts = datetime.fromisoformat(entry.get("ts", "")).timestamp()
+                except (AttributeError, TypeError, ValueError):
+                    continue
+                events.append(
+                    {
+                        "name": name,
+                        "ts": ts,
+                        "day": event_day(ts),
+                        "user_id": entry.get("user", ""),
+                        "chat": entry.get("chat", ""),
+                    }
+                )
+
+        insert_command_events(events)
+        kv_delete(self._scope, self._key)
+        log_info(f"Analytics: migrated {len(events)} legacy records")
 
     def _save(self) -> None:
-        """Persist analytics data to database."""
-        kv_set_json(self._scope, self._key, self._data)
-        self._dirty = False
+        """Persist buffered analytics records to database."""
+        events, self._pending = self._pending, []
         self._last_save_ts = time.time()
-
-    def _schedule_save(self, force: bool = False) -> None:
-        """Persist analytics on interval to reduce write volume."""
-        self._dirty = True
-        now = time.time()
-        if force or now - self._last_save_ts >= SAVE_INTERVAL_SECONDS:
-            self._save()
+        try:
+            insert_command_events(events)
+        except Exception as e:
+            self._save_failed = True
+            self._pending[:0] = events
+            log_error(f"Analytics: failed to save {len(events)} records, will retry: {e}")
+            dropped = len(self._pending) - MAX_PENDING_EVENTS
+            if dropped > 0:
+                del self._pending[:dropped]
+                log_error(f"Analytics: buffer full, dropped {dropped} oldest records")
+        else:
+            self._save_failed = False
+
+    def _schedule_save(self) -> None:
+        """
+        Persist analytics behind the hot path.
+
+        Records are written once SAVE_BATCH_SIZE have piled up, or by a flush
+        scheduled SAVE_INTERVAL_SECONDS after the first unsaved record. After a
+        failed save only the timed flush retries, so commands don't block on a
+        database that keeps failing.
+        """
+        if len(self._pending) >= SAVE_BATCH_SIZE and not self._save_failed:
+            self.flush()
+            return
+
+        if self._flush_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if time.time() - self._last_save_ts >= SAVE_INTERVAL_SECONDS:
+                self._save()
+            return
+
+        self._flush_handle = loop.call_later(SAVE_INTERVAL_SECONDS, self.flush)
 
     def flush(self) -> None:
         """Flush pending analytics writes."""
-        if self._dirty:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending:
             self._save()
 
     def record_command(self, name: str, user_jid: str = "", chat_jid: str = "") -> None:
         """Record a command execution."""
-        if "commands" not in self._data:
-            self._data["commands"] = {}
-
-        if name not in self._data["commands"]:
-            self._data["commands"][name] = []
-
-        self._data["commands"][name].append(
+        now = time.time()
+        self._pending.append(
             {
-                "ts": datetime.now().isoformat(),
-                "user": user_jid.split("@")[0] if user_jid else "",
+                "name": name,
+                "ts": now,
+                "day": event_day(now),
+                "user_id": user_jid.split("@")[0] if user_jid else "",
                 "chat": chat_jid,
             }
         )
 
-        self._prune()
+        if now - self._last_prune_ts >= PRUNE_INTERVAL_SECONDS:
+            self._prune()
+            self._last_prune_ts = now
+
         self._schedule_save()
         log_debug(f"Analytics: recorded {name}")
 
     def _prune(self) -> None:
         """Remove entries older than retention period."""
-        cutoff = (datetime.now() - timedelta(days=DEFAULT_RETENTION_DAYS)).isoformat()
-
-        for cmd_name in list(self._data.get("commands", {})):
-            entries = self._data["commands"][cmd_name]
-            self._data["commands"][cmd_name] = [e for e in entries if e.get("ts", "") >= cutoff]
-            if not self._data["commands"][cmd_name]:
-                del self._data["commands"][cmd_name]
+        delete_command_events_before(time.time() - DEFAULT_RETENTION_DAYS * 86400)
 
     def get_top_commands(self, days: int = 7, chat_jid: str = "") -> list[dict]:
         """Get top commands by usage in the last N days, optionally filtered by chat."""
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-
-        counts = {}
-        for cmd_name, entries in self._data.get("commands", {}).items():
-            count = 0
-            for e in entries:
-                if e.get("ts", "") >= cutoff:
-                    if chat_jid and e.get("chat") != chat_jid:
-                        continue
-                    count += 1
-
-            if count > 0:
-                counts[cmd_name] = count
-
-        sorted_cmds = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-        return [{"command": name, "count": count} for name, count in sorted_cmds]
+        self.flush()
+        counts = count_command_events(time.time() - days * 86400, chat_jid)
+        return [{"command": name, "count": count} for name, count in counts]
 
     def get_usage_timeline(
         self, command: str = "", days: int = 7, chat_jid: str = ""
     ) -> list[dict]:
         """Get daily usage timeline for a command (or all commands), optionally filtered by chat."""
+        self.flush()
         now = datetime.now()
         daily: dict[str, int] = {}
 
@@ -111,33 +161,18 @@ class CommandAnalytics:
             date = (now - timedelta(days=i)).strftime("%Y-%m-%d")
             daily[date] = 0
 
-        cmds = (
-            {command: self._data.get("commands", {}).get(command, [])}
-            if command
-            else self._data.get("commands", {})
-        )
-
-        for _cmd_name, entries in cmds.items():
-            for entry in entries:
-                if chat_jid and entry.get("chat") != chat_jid:
-                    continue
-                date = entry.get("ts", "")[:10]
-                if date in daily:
-                    daily[date] += 1
+        start = (now - timedelta(days=days - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        for date, count in count_command_events_by_day(start.timestamp(), command, chat_jid):
+            if date in daily:
+                daily[date] += count
 
         return [{"date": date, "count": count} for date, count in sorted(daily.items())]
 
     def get_total_commands(self, days: int = 7, chat_jid: str = "") -> int:
         """Get total command count in the last N days, optionally filtered by chat."""
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        total = 0
-        for entries in self._data.get("commands", {}).values():
-            for e in entries:
-                if e.get("ts", "") >= cutoff:
-                    if chat_jid and e.get("chat") != chat_jid:
-                        continue
-                    total += 1
-        return total
+        self.flush()
+        return total_command_events(time.time() - days * 86400, chat_jid)
 
 
 command_analytics = CommandAnalytics()
+atexit.register(command_analytics.flush)
@@ -5,25 +5,64 @@ Stores recent messages for a configurable TTL to enable
 forwarding deleted messages.
 """
 
+import asyncio
 import pickle
 import sqlite3
+import threading
 import time
 import zlib
 from typing import Any
 
-from google.protobuf.json_format import MessageToDict
-
 from config.settings import ANTI_DELETE_CACHE_TTL
 from core.logger import log_error, log_info
 from core.storage import DATA_DIR
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Expired and overflow rows are trimmed once per this many stores rather
+# than on every insert; get() still enforces the TTL on its own.
+TRIM_EVERY_WRITES = 100
+
+# Every zstd frame starts with this magic number, so zstd and legacy zlib
+# blobs can share the table and be told apart on read.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_zstd_local = threading.local()
+
+
+def _zstd_codecs():
+    """Get this thread's zstd compressor/decompressor (they are not thread-safe)."""
+    codecs = getattr(_zstd_local, "codecs", None)
+    if codecs is None:
+        codecs = (zstandard.ZstdCompressor(level=3), zstandard.ZstdDecompressor())
+        _zstd_local.codecs = codecs
+    return codecs
+
+
+def _compress(payload: bytes) -> bytes:
+    """Compress a payload with zstd when it is installed, zlib otherwise."""
+    if zstandard is not None:
+        return _zstd_codecs()[0].compress(payload)
+    return zlib.compress(payload)
+
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompress a payload written by either codec."""
+    if blob[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read this cached message")
+        return _zstd_codecs()[1].decompress(blob)
+    return zlib.decompress(blob)
+
 
 class MessageCache:
     """
     SQLite-backed persistent cache for messages.
 
     Uses a single SQLite database file to store messages.
-    Data is Pickled and Zlib-compressed to minimize size.
+    Data is Pickled and compressed (zstd if available, else zlib) to minimize size.
     This avoids Base64 overhead for media files and allows efficient
     random access without loading the entire cache into memory.
     """
@@ -33,6 +72,7 @@ class MessageCache:
         self._ttl_seconds = ttl_minutes * 60
         self._max_size = max_size
         self._conn: sqlite3.Connection | None = None
+        self._writes_since_trim = 0
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
@@ -42,6 +82,8 @@ class MessageCache:
             self._conn = sqlite3.connect(self._db_file, check_same_thread=False)
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=268435456")
         return self._conn
 
     def _init_db(self):
@@ -61,80 +103,121 @@ class MessageCache:
         except Exception as e:
             log_error(f"Failed to init message cache DB: {e}")
 
-    def store(self, message_id: str, data: dict[str, Any]) -> None:
-        """Store a message in the cache."""
-        try:
-            data_copy = data.copy()
+    @staticmethod
+    def _serialize(data: dict[str, Any]) -> bytes:
+        """Pickle and compress a message payload."""
+        payload = {k: v for k, v in data.items() if k != "message"}
+
+        message = data.get("message")
+        if message and not data.get("message_bytes"):
+            try:
+                payload["message_bytes"] = message.SerializeToString()
+            except Exception:
+                pass
 
-            if data_copy.get("message") and not data_copy.get("message_dict"):
-                try:
-                    data_copy["message_dict"] = MessageToDict(data_copy["message"])
-                except Exception:
-                    pass
-            data_copy.pop("message", None)
+        return _compress(pickle.dumps(payload))
 
-            serialized = pickle.dumps(data_copy)
-            compressed = zlib.compress(serialized)
+    @staticmethod
+    def _deserialize(blob: bytes) -> dict[str, Any]:
+        """Decompress and unpickle a message payload."""
+        return pickle.loads(_decompress(blob))
 
-            timestamp = time.time()
-            conn = self._get_conn()
+    def _write(self, message_id: str, blob: bytes) -> None:
+        """Insert a serialized message, trimming the table periodically."""
+        timestamp = time.time()
+        conn = self._get_conn()
 
-            conn.execute(
-                "INSERT OR REPLACE INTO messages (id, timestamp, data) VALUES (?, ?, ?)",
-                (message_id, timestamp, compressed),
-            )
+        conn.execute(
+            "INSERT OR REPLACE INTO messages (id, timestamp, data) VALUES (?, ?, ?)",
+            (message_id, timestamp, blob),
+        )
 
-            cursor = conn.execute("SELECT COUNT(*) FROM messages")
-            count = cursor.fetchone()[0]
-
-            if count > self._max_size:
-                conn.execute(
-                    """
-                    DELETE FROM messages WHERE id IN (
-                        SELECT id FROM messages ORDER BY timestamp ASC LIMIT ?
-                    )
-                """,
-                    (count - self._max_size,),
-                )
+        self._writes_since_trim += 1
+        if self._writes_since_trim >= TRIM_EVERY_WRITES:
+            self._trim(conn, timestamp)
+        conn.commit()
 
-            conn.execute(
-                "DELETE FROM messages WHERE timestamp < ?",
-                (timestamp - self._ttl_seconds,),
-            )
+    def _read(self, message_id: str) -> bytes | None:
+        """Fetch a serialized message if it exists and hasn't expired."""
+        conn = self._get_conn()
+        cursor = conn.execute("SELECT timestamp, data FROM messages WHERE id = ?", (message_id,))
+        row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        timestamp, blob = row
+
+        if time.time() - timestamp > self._ttl_seconds:
+            conn.execute("DELETE FROM messages WHERE id = ?", (message_id,))
             conn.commit()
+            return None
+
+        return blob
+
+    def store(self, message_id: str, data: dict[str, Any]) -> None:
+        """Store a message in the cache."""
+        try:
+            self._write(message_id, self._serialize(data))
+        except Exception as e:
+            log_error(f"Failed to store message {message_id}: {e}")
 
+    async def store_async(self, message_id: str, data: dict[str, Any]) -> None:
+        """Store a message, serializing and compressing it off the event loop."""
+        try:
+            blob = await asyncio.to_thread(self._serialize, data)
+            self._write(message_id, blob)
         except Exception as e:
             log_error(f"Failed to store message {message_id}: {e}")
 
+    def _trim(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired messages and the oldest ones beyond max_size."""
+        self._writes_since_trim = 0
+        conn.execute("DELETE FROM messages WHERE timestamp < ?", (now - self._ttl_seconds,))
+
+        count = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        if count > self._max_size:
+            conn.execute(
+                """
+                DELETE FROM messages WHERE id IN (
+                    SELECT id FROM messages ORDER BY timestamp ASC LIMIT ?
+                )
+            """,
+                (count - self._max_size,),
+            )
+
     def get(self, message_id: str) -> dict[str, Any] | None:
         """Get a message from the cache if it exists and hasn't expired."""
         try:
-            conn = self._get_conn()
-            cursor = conn.execute(
-                "SELECT timestamp, data FROM messages WHERE id = ?", (message_id,)
-            )
-            row = cursor.fetchone()
+            blob = self._read(message_id)
+        except Exception as e:
+            log_error(f"Failed to get message {message_id}: {e}")
+            return None
 
-            if not row:
-                return None
+        if blob is None:
+            return None
 
-            timestamp, blob = row
+        try:
+            return self._deserialize(blob)
+        except Exception as e:
+            log_error(f"Failed to deserialize message {message_id}: {e}")
+            return None
 
-            if time.time() - timestamp > self._ttl_seconds:
-                conn.execute("DELETE FROM messages WHERE id = ?", (message_id,))
-                conn.commit()
-                return None
+    async def get_async(self, message_id: str) -> dict[str, Any] | None:
+        """Get a message, decompressing and unpickling it off the event loop."""
+        try:
+            blob = self._read(message_id)
+        except Exception as e:
+            log_error(f"Failed to get message {message_id}: {e}")
+            return None
 
-            try:
-                decompressed = zlib.decompress(blob)
-                data = pickle.loads(decompressed)
-                return data
-            except Exception as e:
-                log_error(f"Failed to deserialize message {message_id}: {e}")
-                return None
+        if blob is None:
+            return None
 
+        try:
+            return await asyncio.to_thread(self._deserialize, blob)
         except Exception as e:
-            log_error(f"Failed to get message {message_id}: {e}")
+            log_error(f"Failed to deserialize message {message_id}: {e}")
             return None
 
     def remove(self, message_id: str) -> dict[str, Any] | None:
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
     from core.client import BotClient
     from core.message import MessageHelper
 
+# A prefix containing any of these is treated as a regex rather than a literal string.
+_REGEX_CHARS_RE = re.compile(r"[\^$.*+?{}\[\]|()\\]")
+
 
 @dataclass
 class CommandContext:
@@ -159,7 +162,12 @@ class CommandLoader:
     def __init__(self) -> None:
         self._commands: dict[str, Command] = {}
         self._aliases: dict[str, str] = {}
+        self._unique_cache: list[Command] | None = None
+        self._unique_names_cache: list[str] | None = None
         self._prefix_pattern: re.Pattern | None = None
+        self._current_prefix: str | None = None
+        self._prefix_is_regex = False
+        self._config_version = runtime_config.version
         self._setup_prefix()
         self._load_aliases()
 
@@ -170,18 +178,19 @@ class CommandLoader:
     def _setup_prefix(self) -> None:
         """Setup the prefix matching pattern (auto-detects regex vs string, handles empty)."""
         prefix = self._get_prefix()
+        if prefix == self._current_prefix and self._prefix_pattern is not None:
+            return
 
         if not prefix:
             self._prefix_pattern = re.compile(r"^")
             self._current_prefix = ""
+            self._prefix_is_regex = False
             return
 
         self._current_prefix = prefix
+        self._prefix_is_regex = bool(_REGEX_CHARS_RE.search(prefix))
 
-        regex_chars = r"^$.*+?{}[]|()\\"
-        is_regex = any(c in prefix for c in regex_chars)
-
-        if is_regex:
+        if self._prefix_is_regex:
             self._prefix_pattern = re.compile(prefix)
         else:
             self._prefix_pattern = re.compile(re.escape(prefix))
@@ -202,9 +211,40 @@ class CommandLoader:
         Args:
             command: The command instance to register
         """
+        command.category = command.category.lower()
         self._commands[command.name.lower()] = command
         for alias in command.aliases:
             self._commands[alias.lower()] = command
+        self._invalidate_caches()
+
+    def unregister(self, name: str) -> Command | None:
+        """
+        Remove a command and all of its aliases.
+
+        Args:
+            name: The command name or one of its aliases
+
+        Returns:
+            The removed Command, or None if it wasn't registered
+        """
+        command = self._commands.get(name.lower())
+        if command is None:
+            return None
+        for key in (command.name, *command.aliases):
+            if self._commands.get(key.lower()) is command:
+                del self._commands[key.lower()]
+        self._invalidate_caches()
+        return command
+
+    def clear(self) -> None:
+        """Remove every registered command."""
+        self._commands.clear()
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop the derived command lists after the registry changes."""
+        self._unique_cache = None
+        self._unique_names_cache = None
 
     def get(self, name: str) -> Command | None:
         """
@@ -234,8 +274,9 @@ class CommandLoader:
         Returns:
             List of similar command names
         """
-        all_names = list({cmd.name for cmd in self._commands.values()})
-        return get_close_matches(name.lower(), all_names, n=max_results, cutoff=0.5)
+        if self._unique_names_cache is None:
+            self._unique_names_cache = [cmd.name for cmd in self.unique_commands]
+        return get_close_matches(name.lower(), self._unique_names_cache, n=max_results, cutoff=0.5)
 
     @property
     def all_commands(self) -> dict[str, Command]:
@@ -249,34 +290,39 @@ class CommandLoader:
 
     @property
     def unique_commands(self) -> list[Command]:
-        """Get unique commands (no duplicates from aliases)."""
-        seen = set()
-        result = []
-        for cmd in self._commands.values():
-            if cmd.name not in seen:
-                seen.add(cmd.name)
-                result.append(cmd)
-        return result
+        """Get unique commands (no duplicates from aliases).
+
+        The list is cached until the registry changes; callers must not mutate it.
+        """
+        if self._unique_cache is None:
+            seen = set()
+            result = []
+            for cmd in self._commands.values():
+                if cmd.name not in seen:
+                    seen.add(cmd.name)
+                    result.append(cmd)
+            self._unique_cache = result
+        return self._unique_cache
 
     def get_commands_by_category(self) -> dict[str, list[Command]]:
         """
         Get commands organized by category.
 
         Returns:
-            Dict mapping category name to list of commands
+            Dict mapping lowercase category name to list of commands
         """
         result: dict[str, list[Command]] = {}
 
         for cmd in self.unique_commands:
             if not cmd.enabled:
                 continue
-            category = cmd.category.title() or "General"
+            category = cmd.category or "general"
             if category not in result:
                 result[category] = []
             result[category].append(cmd)
 
-        for category in result:
-            result[category.title()].sort(key=lambda c: c.name)
+        for commands in result.values():
+            commands.sort(key=lambda c: c.name)
 
         return result
 
@@ -285,19 +331,15 @@ class CommandLoader:
         Get commands organized by category (for help menu).
 
         Returns:
-            Dict mapping category name to list of commands
+            Dict mapping lowercase category name to list of commands
         """
         result: dict[str, list[Command]] = {}
-        seen = set()
 
-        for cmd in self._commands.values():
-            if cmd.name in seen:
-                continue
+        for cmd in self.unique_commands:
             if not cmd.enabled:
                 continue
 
-            seen.add(cmd.name)
-            category = cmd.category.title() or "Other"
+            category = cmd.category or "other"
 
             if category not in result:
                 result[category] = []
@@ -322,22 +364,31 @@ class CommandLoader:
         if not text:
             return None, "", []
 
-        current_prefix = self._get_prefix()
-        if not hasattr(self, "_current_prefix") or current_prefix != self._current_prefix:
+        if self._config_version != runtime_config.version:
+            self._config_version = runtime_config.version
             self._setup_prefix()
 
-        match = self._prefix_pattern.match(text)
-        if not match:
-            return None, "", []
+        # Most messages aren't commands; a literal prefix is rejected with a
+        # plain startswith and only regex prefixes go through the pattern.
+        if self._prefix_is_regex:
+            match = self._prefix_pattern.match(text)
+            if not match:
+                return None, "", []
+            start = match.end()
+        else:
+            prefix = self._current_prefix
+            if prefix and not text.startswith(prefix):
+                return None, "", []
+            start = len(prefix)
 
-        remaining = text[match.end() :].strip()
+        remaining = text[start:].strip()
         if not remaining:
             return None, "", []
 
-        parts = remaining.split(maxsplit=1)
+        parts = remaining.split()
         command_name = parts[0].lower()
-        raw_args = parts[1] if len(parts) > 1 else ""
-        args = raw_args.split() if raw_args else []
+        args = parts[1:]
+        raw_args = remaining[len(parts[0]) :].lstrip() if args else ""
 
         if not self._current_prefix:
             if not self.get(command_name):
@@ -365,7 +416,7 @@ class CommandLoader:
             if group_dir.name.startswith("_"):
                 continue
 
-            category = group_dir.name.replace("_", " ").title()
+            category = group_dir.name.replace("_", " ")
 
             for file_path in group_dir.glob("*.py"):
                 if file_path.name.startswith("_"):
@@ -382,6 +433,7 @@ class CommandLoader:
                             isinstance(attr, type)
                             and issubclass(attr, Command)
                             and attr is not Command
+                            and attr.__module__ == module_name
                             and hasattr(attr, "name")
                             and attr.name
                         ):
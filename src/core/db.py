@@ -5,6 +5,7 @@ Provides:
 - Optional PostgreSQL via `DATABASE_URL`
 - Generic key/value JSON store APIs
 - Webhook and webhook delivery persistence
+- Command analytics events
 - One-time migration from legacy JSON files
 """
 
@@ -76,6 +77,7 @@ def _ensure_tables(engine: Engine) -> None:
         "BIGSERIAL PRIMARY KEY" if dialect == "postgresql" else "INTEGER PRIMARY KEY AUTOINCREMENT"
     )
     webhook_fk_type = "BIGINT" if dialect == "postgresql" else "INTEGER"
+    float_type = "DOUBLE PRECISION" if dialect == "postgresql" else "REAL"
 
     with engine.begin() as conn:
         conn.execute(
@@ -135,6 +137,41 @@ def _ensure_tables(engine: Engine) -> None:
             )
         )
 
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS command_events (
+                    id {id_column},
+                    name TEXT NOT NULL,
+                    ts {float_type} NOT NULL,
+                    user_id TEXT NOT NULL,
+                    chat TEXT NOT NULL,
+                    day TEXT NOT NULL
+                )
+                """
+            )
+        )
+
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_command_events_ts ON command_events(ts)"))
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_command_events_day ON command_events(day)")
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_command_events_name_ts ON command_events(name, ts)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_command_events_chat_ts ON command_events(chat, ts)"
+            )
+        )
+
+
+def event_day(ts: float) -> str:
+    """Local calendar date (YYYY-MM-DD) a command event is bucketed under."""
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
 
 def _safe_jid(jid: str) -> str:
     return jid.replace(":", "_").replace("@", "_")
@@ -626,3 +663,89 @@ def list_webhook_deliveries(webhook_id: int, limit: int = 50) -> list[dict[str,
             }
         )
     return deliveries
+
+
+def insert_command_events(events: list[dict[str, Any]]) -> None:
+    """Persist a batch of command events (name, ts, day, user_id, chat)."""
+    if not events:
+        return
+    ensure_database_ready()
+    with get_engine().begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO command_events(name, ts, day, user_id, chat)
+                VALUES (:name, :ts, :day, :user_id, :chat)
+                """
+            ),
+            events,
+        )
+
+
+def delete_command_events_before(ts: float) -> int:
+    """Delete command events older than the given epoch timestamp."""
+    ensure_database_ready()
+    with get_engine().begin() as conn:
+        result = conn.execute(
+            text("DELETE FROM command_events WHERE ts < :ts"),
+            {"ts": float(ts)},
+        )
+    return result.rowcount
+
+
+def _command_event_filters(since: float, command: str = "", chat_jid: str = "") -> tuple[str, dict]:
+    clauses = ["ts >= :since"]
+    params: dict[str, Any] = {"since": float(since)}
+    if command:
+        clauses.append("name = :name")
+        params["name"] = command
+    if chat_jid:
+        clauses.append("chat = :chat")
+        params["chat"] = chat_jid
+    return " AND ".join(clauses), params
+
+
+def count_command_events(since: float, chat_jid: str = "") -> list[tuple[str, int]]:
+    """Count command events per command name since an epoch timestamp, busiest first."""
+    ensure_database_ready()
+    where, params = _command_event_filters(since, chat_jid=chat_jid)
+    with get_engine().begin() as conn:
+        rows = conn.execute(
+            text(
+                f"""
+                SELECT name, COUNT(*) AS uses
+                FROM command_events
+                WHERE {where}
+                GROUP BY name
+                ORDER BY uses DESC, name ASC
+                """
+            ),
+            params,
+        ).fetchall()
+    return [(str(row[0]), int(row[1])) for row in rows]
+
+
+def total_command_events(since: float, chat_jid: str = "") -> int:
+    """Count all command events since an epoch timestamp."""
+    ensure_database_ready()
+    where, params = _command_event_filters(since, chat_jid=chat_jid)
+    with get_engine().begin() as conn:
+        total = conn.execute(
+            text(f"SELECT COUNT(*) FROM command_events WHERE {where}"),
+            params,
+        ).scalar_one()
+    return int(total)
+
+
+def count_command_events_by_day(
+    since: float, command: str = "", chat_jid: str = ""
+) -> list[tuple[str, int]]:
+    """Count command events per local day since an epoch timestamp."""
+    ensure_database_ready()
+    where, params = _command_event_filters(since, command, chat_jid)
+    with get_engine().begin() as conn:
+        rows = conn.execute(
+            text(f"SELECT day, COUNT(*) FROM command_events WHERE {where} GROUP BY day"),
+            params,
+        ).fetchall()
+    return [(str(row[0]), int(row[1])) for row in rows]
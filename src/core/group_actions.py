@@ -9,6 +9,7 @@ from neonize.utils.enum import ParticipantChange
 from core.command import CommandContext
 from core.errors import report_error
 from core.i18n import t_error, t_info, t_success
+from core.permissions import invalidate_admin_cache
 from core.targets import parse_targets
 
 _ACTION_MAP = {
@@ -54,6 +55,7 @@ async def update_participants(
         await ctx.client._client.update_group_participants(
             ctx.client.to_jid(group_jid), target_jids, neonize_action
         )
+        invalidate_admin_cache(group_jid)
         count = len(targets)
         await ctx.client.reply(ctx.message, t_success(f"members.{action_key}_success", count=count))
     except Exception as e:
@@ -38,7 +38,7 @@ async def handle_anti_delete_cache(bot: BotClient, event: any, msg: any):
         "message_bytes": event.Message.SerializeToString(),
     }
 
-    message_cache.store(event.Info.ID, cache_data)
+    await message_cache.store_async(event.Info.ID, cache_data)
 
 
 async def handle_anti_revoke(bot: BotClient, event: any, msg: any):
@@ -63,7 +63,7 @@ async def handle_anti_revoke(bot: BotClient, event: any, msg: any):
         revoked_msg_id = proto_msg.key.ID
         log_info(f"[ANTI-DELETE] Message {revoked_msg_id} was deleted by {msg.sender_name}")
 
-        cached = message_cache.get(revoked_msg_id)
+        cached = await message_cache.get_async(revoked_msg_id)
         if not cached:
             log_warning(
                 f"[ANTI-DELETE] Could not find message {revoked_msg_id} in cache (may be too old)"
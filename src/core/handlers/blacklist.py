@@ -7,7 +7,7 @@ from core.client import BotClient
 from core.logger import log_info
 from core.message import MessageHelper
 from core.moderation import execute_moderation_action, is_admin
-from core.storage import GroupData
+from core.storage import get_group_data
 
 
 async def handle_blacklist(bot: BotClient, msg: MessageHelper) -> bool:
@@ -26,8 +26,7 @@ async def handle_blacklist(bot: BotClient, msg: MessageHelper) -> bool:
     if msg.is_from_me:
         return False
 
-    data = GroupData(msg.chat_jid)
-    blacklisted = data.blacklist
+    blacklisted = get_group_data(msg.chat_jid).blacklist_casefolded
 
     if not blacklisted:
         return False
@@ -35,10 +34,10 @@ async def handle_blacklist(bot: BotClient, msg: MessageHelper) -> bool:
     if await is_admin(bot, msg.chat_jid, msg.sender_jid):
         return False
 
-    text_lower = msg.text.lower()
+    text_folded = msg.text.casefold()
 
     for word in blacklisted:
-        if word.lower() in text_lower:
+        if word in text_folded:
             try:
                 await execute_moderation_action(bot, msg, "delete", "blacklist")
                 await execute_moderation_action(bot, msg, "warn", "blacklist")
@@ -15,6 +15,26 @@ from core.storage import GroupData as GroupStorage
 if TYPE_CHECKING:
     from core.command import CommandContext
 
+PLACEHOLDERS_HELP = (
+    "• `{name}` - Member's name\n"
+    "• `{mention}` - @mention the member\n"
+    "• `{group}` - Group name\n"
+    "• `{count}` - Member count\n"
+    "• `{date}` - Current date\n"
+    "• `{time}` - Current time"
+)
+
+_CONFIG_HELP = (
+    "*{title} Message Configuration*\n\n"
+    "Status: *{status}*\n"
+    "Message: {message}\n\n"
+    "Usage:\n"
+    "• `{config_type} on` - Turn on\n"
+    "• `{config_type} off` - Turn off\n"
+    "• `{config_type} set <message>` - Set message\n\n"
+    "Placeholders: {placeholders}"
+)
+
 
 async def _resolve_placeholders(
     message: str, bot, group_jid: str, member_jid: str, member_name: str
@@ -181,15 +201,12 @@ async def handle_welcome_goodbye_config(
         status = t("common.on") if config.get("enabled", False) else t("common.off")
         msg = config.get("message", "-")
 
-        reply = (
-            f"*{config_type.capitalize()} Message Configuration*\n\n"
-            f"Status: *{status}*\n"
-            f"Message: {msg}\n\n"
-            f"Usage:\n"
-            f"• `{config_type} on` - Turn on\n"
-            f"• `{config_type} off` - Turn off\n"
-            f"• `{config_type} set <message>` - Set message\n\n"
-            f"Placeholders: {placeholders_help}"
+        reply = _CONFIG_HELP.format(
+            title=config_type.capitalize(),
+            status=status,
+            message=msg,
+            config_type=config_type,
+            placeholders=placeholders_help,
         )
         await ctx.client.reply(ctx.message, reply)
         return
@@ -0,0 +1,20 @@
+"""
+Formatting helpers shared by help/menu style commands.
+"""
+
+from core import symbols as sym
+
+CATEGORY_ICONS = {
+    "general": sym.INFO,
+    "admin": sym.USER,
+    "group": sym.GROUP,
+    "owner": sym.SETTINGS,
+    "moderation": sym.WARNING,
+    "content": sym.SPARKLE,
+    "utility": sym.COMMAND,
+}
+
+
+def category_icon(category: str) -> str:
+    """Get the icon for a lowercase category name, falling back to a diamond."""
+    return CATEGORY_ICONS.get(category, sym.DIAMOND)
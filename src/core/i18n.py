@@ -13,6 +13,7 @@ from core.db import kv_get_json, kv_set_json
 from core.runtime_config import runtime_config
 
 _locales: dict[str, dict] = {}
+_flat_locales: dict[str, dict[str, str]] = {}
 _default_lang: str = "en"
 _chat_languages: dict[str, str] = {}
 
@@ -31,6 +32,19 @@ def get_context() -> str | None:
     return _current_chat.get()
 
 
+def _flatten(data: dict, prefix: str = "", out: dict[str, str] | None = None) -> dict[str, str]:
+    """Flatten nested locale data into dot-notation keys, keeping only strings."""
+    if out is None:
+        out = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+        elif isinstance(value, str):
+            out[path] = value
+    return out
+
+
 def load_locale(lang: str = "en") -> dict:
     """
     Load a locale file into cache.
@@ -57,6 +71,7 @@ def load_locale(lang: str = "en") -> dict:
     try:
         with open(locale_file, encoding="utf-8") as f:
             _locales[lang] = json.load(f)
+            _flat_locales[lang] = _flatten(_locales[lang])
             return _locales[lang]
     except Exception:
         return {}
@@ -122,26 +137,18 @@ def t(key: str, chat_jid: str | None = None, **kwargs) -> str:
     """
     lang = get_language(chat_jid)
 
-    if lang not in _locales:
+    strings = _flat_locales.get(lang)
+    if strings is None:
         load_locale(lang)
+        strings = _flat_locales.get(lang, {})
 
-    locale = _locales.get(lang, {})
-
-    parts = key.split(".")
-    value = locale
-
-    for part in parts:
-        if isinstance(value, dict) and part in value:
-            value = value[part]
-        else:
-            return key
-
-    if not isinstance(value, str):
+    value = strings.get(key)
+    if value is None:
         return key
 
     if kwargs:
         try:
-            return value.format(**kwargs)
+            return value.format_map(kwargs)
         except KeyError:
             return value
 
@@ -198,10 +205,12 @@ def reload_locales(lang: str | None = None) -> None:
 
     if lang:
         _locales.pop(lang, None)
+        _flat_locales.pop(lang, None)
         load_locale(lang)
         return
 
     _locales.clear()
+    _flat_locales.clear()
     _load_available_languages()
     load_locale(_default_lang)
 
@@ -228,10 +228,14 @@ def log_raw_message(event_data: dict) -> None:
         )
 
 
+def is_debug_enabled() -> bool:
+    """Check whether debug logging is on, so callers can skip building messages."""
+    return runtime_config.get_nested("logging", "level", default="INFO").upper() == "DEBUG"
+
+
 def log_debug(message: str) -> None:
     """Log a debug message (only if log level is DEBUG)."""
-    level = runtime_config.get_nested("logging", "level", default="INFO")
-    if level.upper() == "DEBUG":
+    if is_debug_enabled():
         _line(_badge("DEBUG", "white", "#555555"), f"[dim]{message}[/dim]")
         log_to_file(message, "DEBUG")
 
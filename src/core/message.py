@@ -127,7 +127,7 @@ class MessageHelper:
     @property
     def is_group(self) -> bool:
         """Check if message is from a group chat."""
-        return "@g.us" in self.chat_jid
+        return self.chat_jid.endswith("@g.us")
 
     @property
     def is_private(self) -> bool:
@@ -9,6 +9,7 @@ Provides:
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 from neonize.proto.Neonize_pb2 import GroupParticipant
@@ -22,6 +23,11 @@ if TYPE_CHECKING:
     from core.command import Command
     from core.message import MessageHelper
 
+ADMIN_CACHE_TTL = 30.0
+ADMIN_CACHE_MAX_SIZE = 4096
+
+_admin_cache: dict[tuple[str, str], tuple[float, bool]] = {}
+
 
 def is_group_admin(participant: GroupParticipant) -> bool:
     """Check if participant is a group admin."""
@@ -51,12 +57,30 @@ async def get_participant(
     return None
 
 
+def invalidate_admin_cache(group_jid: str | None = None) -> None:
+    """Forget cached admin checks for one group, or for all groups."""
+    if group_jid is None:
+        _admin_cache.clear()
+        return
+    for key in [key for key in _admin_cache if key[0] == group_jid]:
+        del _admin_cache[key]
+
+
 async def check_admin_permission(client: BotClient, group_jid: str, user_jid: str) -> bool:
     """Check if user is admin in the group."""
+    key = (group_jid, user_jid)
+    now = time.monotonic()
+    cached = _admin_cache.get(key)
+    if cached and now - cached[0] < ADMIN_CACHE_TTL:
+        return cached[1]
+
     participant = await get_participant(client, group_jid, user_jid)
-    if participant:
-        return is_group_admin(participant)
-    return False
+    is_admin = is_group_admin(participant) if participant else False
+
+    if len(_admin_cache) >= ADMIN_CACHE_MAX_SIZE:
+        _admin_cache.pop(next(iter(_admin_cache)))
+    _admin_cache[key] = (now, is_admin)
+    return is_admin
 
 
 async def check_bot_admin(client: BotClient, group_jid: str) -> bool:
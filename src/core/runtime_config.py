@@ -16,13 +16,12 @@ from typing import Any
 from jsonschema import Draft7Validator
 
 from core import jsonc
+from core.constants import BASE_DIR, DATA_DIR
 
-CONFIG_FILE = Path(__file__).parent.parent.parent / "config.json"
+CONFIG_FILE = BASE_DIR / "config.json"
 SCHEMA_FILE = Path(__file__).parent.parent.parent / "config.schema.json"
-OVERRIDES_FILE = Path(__file__).parent.parent.parent / "data" / "runtime_overrides.json"
-OVERRIDES_MIGRATION_MARKER = (
-    Path(__file__).parent.parent.parent / "data" / ".runtime_overrides_migrated"
-)
+OVERRIDES_FILE = DATA_DIR / "runtime_overrides.json"
+OVERRIDES_MIGRATION_MARKER = DATA_DIR / ".runtime_overrides_migrated"
 DEFAULT_SCHEMA_PATH = "./config.schema.json"
 
 DEFAULT_CONFIG = {
@@ -144,6 +143,7 @@ class RuntimeConfig:
             return
         self._initialized = True
         self._config: dict[str, Any] = {}
+        self._version = 0
         self._validator = Draft7Validator(self._load_schema())
         self._load()
 
@@ -419,6 +419,7 @@ class RuntimeConfig:
             self._assert_valid_config(config)
 
             self._config = config
+            self._version += 1
 
             if migrated or normalized or "$schema" not in loaded:
                 self._save()
@@ -426,6 +427,7 @@ class RuntimeConfig:
         except Exception as e:
             print(f"[CONFIG] Error loading config: {e}")
             self._config = self._ensure_schema_key(deepcopy(DEFAULT_CONFIG))
+            self._version += 1
             self._save()
 
     def _merge_defaults(self, config: dict, defaults: dict) -> dict:
@@ -457,12 +459,18 @@ class RuntimeConfig:
         normalized = self._ensure_schema_key(candidate)
         self._assert_valid_config(normalized)
         self._config = normalized
+        self._version += 1
         jsonc.dump(self._config, CONFIG_FILE, indent=2)
 
     def reload(self) -> None:
         """Reload configuration from file."""
         self._load()
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the config is loaded or saved, for cheap change checks."""
+        return self._version
+
     @property
     def bot_name(self) -> str:
         return self._config.get("bot", {}).get("name", "Zero Ichi")
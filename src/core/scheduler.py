@@ -490,9 +490,15 @@ class Scheduler:
         """Get a task by ID."""
         return self._tasks.get(task_id)
 
-    def get_tasks_for_chat(self, chat_jid: str) -> list[ScheduledTask]:
-        """Get all tasks for a specific chat."""
-        return [t for t in self._tasks.values() if t.chat_jid == chat_jid]
+    def get_tasks_for_chat(
+        self, chat_jid: str, task_type: str | None = None
+    ) -> list[ScheduledTask]:
+        """Get all tasks for a specific chat, optionally only those of one type."""
+        if task_type is None:
+            return [t for t in self._tasks.values() if t.chat_jid == chat_jid]
+        return [
+            t for t in self._tasks.values() if t.chat_jid == chat_jid and t.task_type == task_type
+        ]
 
     def get_all_tasks(self) -> list[ScheduledTask]:
         """Get all scheduled tasks."""
@@ -5,7 +5,12 @@ Runtime data now uses the shared database layer (`core.db`) instead of JSON file
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any
 
 from core.constants import DATA_DIR
@@ -13,6 +18,49 @@ from core.db import kv_get_json, kv_set_json
 
 DATA_DIR.mkdir(exist_ok=True)
 
+_MISSING = object()
+
+# Loaded group values keyed by (scope, name). Every GroupData instance writes
+# through here, so repeated reads of the same key skip the database round trip.
+# Least recently used entries are dropped past GROUP_VALUE_CACHE_SIZE.
+GROUP_VALUE_CACHE_SIZE = 4096
+_group_values: OrderedDict[tuple[str, str], Any] = OrderedDict()
+
+DEFERRED_SAVE_DELAY = 0.25
+
+_pending_saves: dict[tuple[str, str], Any] = {}
+_flush_handle: asyncio.TimerHandle | None = None
+
+# Background saves share one worker thread so writes to a key land in order.
+_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="group-storage")
+
+# Casefolded blacklist per scope, paired with the cached list it was built from.
+_blacklist_casefolded: dict[str, tuple[Any, frozenset[str]]] = {}
+
+
+def _cache_get(cache_key: tuple[str, str]) -> Any:
+    """Return a cached group value and mark it recently used, or _MISSING."""
+    data = _group_values.get(cache_key, _MISSING)
+    if data is not _MISSING:
+        _group_values.move_to_end(cache_key)
+    return data
+
+
+def _cache_put(cache_key: tuple[str, str], data: Any) -> None:
+    """Cache a group value, evicting the least recently used one when full."""
+    _group_values[cache_key] = data
+    _group_values.move_to_end(cache_key)
+    while len(_group_values) > GROUP_VALUE_CACHE_SIZE:
+        (scope, name), _ = _group_values.popitem(last=False)
+        if name == "blacklist":
+            _blacklist_casefolded.pop(scope, None)
+
+
+def _write_if_current(cache_key: tuple[str, str], snapshot: Any) -> None:
+    """Write a background save unless a newer save replaced it in the meantime."""
+    if _group_values.get(cache_key, snapshot) is snapshot:
+        kv_set_json(*cache_key, snapshot)
+
 
 def safe_jid(jid: str) -> str:
     """Sanitize a JID for compatibility with legacy folder naming."""
@@ -29,17 +77,77 @@ class GroupData:
         self.group_dir = DATA_DIR / safe_jid(group_jid)
         self.group_dir.mkdir(exist_ok=True)
 
+    def _load_cached(self, name: str) -> Any:
+        """Return the shared cached value for a key. Callers must not mutate it."""
+        cache_key = (self.scope, name)
+        data = _cache_get(cache_key)
+        if data is _MISSING:
+            data = _pending_saves.get(cache_key, _MISSING)
+            if data is _MISSING:
+                data = kv_get_json(self.scope, name, default=None)
+            _cache_put(cache_key, data)
+        return data
+
     def load(self, name: str, default: Any = None) -> Any:
         """Load data for a key from database."""
         fallback = default if default is not None else {}
-        data = kv_get_json(self.scope, name, default=None)
+        data = self._load_cached(name)
         if data is None:
             return deepcopy(fallback)
-        return data
+        return deepcopy(data)
 
     def save(self, name: str, data: Any) -> None:
         """Save data for a key in database."""
+        cache_key = (self.scope, name)
+        _pending_saves.pop(cache_key, None)
         kv_set_json(self.scope, name, data)
+        _cache_put(cache_key, deepcopy(data))
+
+    def stage(self, name: str, data: Any) -> None:
+        """
+        Update the cached value for a key without writing it.
+
+        Loads see the change immediately; the caller must follow up with a
+        save to persist it.
+        """
+        _cache_put((self.scope, name), deepcopy(data))
+
+    async def save_async(self, name: str, data: Any) -> None:
+        """
+        Save data for a key, running the database write in a worker thread.
+
+        The cached value is updated before the write is handed off, so a
+        concurrent load of the same key already sees the new value.
+        """
+        cache_key = (self.scope, name)
+        _pending_saves.pop(cache_key, None)
+        snapshot = deepcopy(data)
+        _cache_put(cache_key, snapshot)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_write_executor, _write_if_current, cache_key, snapshot)
+
+    def save_deferred(self, name: str, data: Any) -> None:
+        """
+        Save data for a key, coalescing rapid updates into one database write.
+
+        The cached value is updated immediately so reads see the change; the
+        write itself is flushed after DEFERRED_SAVE_DELAY seconds.
+        """
+        global _flush_handle
+
+        cache_key = (self.scope, name)
+        snapshot = deepcopy(data)
+        _cache_put(cache_key, snapshot)
+        _pending_saves[cache_key] = snapshot
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            flush_group_saves()
+            return
+
+        if _flush_handle is None:
+            _flush_handle = loop.call_later(DEFERRED_SAVE_DELAY, flush_group_saves)
 
     @property
     def settings(self) -> dict:
@@ -63,11 +171,24 @@ class GroupData:
         self.save("filters", filters)
 
     @property
-    def blacklist(self) -> list:
-        return self.load("blacklist", [])
+    def blacklist(self) -> set[str]:
+        return set(self.load("blacklist", []))
+
+    def save_blacklist(self, words: set[str]) -> None:
+        self.save("blacklist", sorted(words))
 
-    def save_blacklist(self, words: list) -> None:
-        self.save("blacklist", words)
+    async def save_blacklist_async(self, words: set[str]) -> None:
+        await self.save_async("blacklist", sorted(words))
+
+    @property
+    def blacklist_casefolded(self) -> frozenset[str]:
+        """Blacklisted words casefolded, rebuilt only when the blacklist changes."""
+        words = self._load_cached("blacklist")
+        cached = _blacklist_casefolded.get(self.scope)
+        if cached is None or cached[0] is not words:
+            cached = (words, frozenset(w.casefold() for w in words or ()))
+            _blacklist_casefolded[self.scope] = cached
+        return cached[1]
 
     @property
     def warnings(self) -> dict:
@@ -76,6 +197,12 @@ class GroupData:
     def save_warnings(self, warnings: dict) -> None:
         self.save("warnings", warnings)
 
+    def stage_warnings(self, warnings: dict) -> None:
+        self.stage("warnings", warnings)
+
+    async def save_warnings_async(self, warnings: dict) -> None:
+        await self.save_async("warnings", warnings)
+
     @property
     def welcome(self) -> dict:
         return self.load("welcome", {"enabled": False, "message": ""})
@@ -120,6 +247,9 @@ class GroupData:
     def save_warnings_config(self, config: dict) -> None:
         self.save("warnings_config", config)
 
+    def save_warnings_config_deferred(self, config: dict) -> None:
+        self.save_deferred("warnings_config", config)
+
     @property
     def reports(self) -> dict:
         return self.load("reports", {"counter": 0, "items": []})
@@ -159,6 +289,35 @@ class GroupData:
         self.save("muted", users)
 
 
+@lru_cache(maxsize=512)
+def get_group_data(group_jid: str) -> GroupData:
+    """Get a shared GroupData instance for a group."""
+    return GroupData(group_jid)
+
+
+def flush_group_saves() -> None:
+    """Write any pending deferred group saves to the database."""
+    global _flush_handle
+
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    while _pending_saves:
+        (scope, name), data = _pending_saves.popitem()
+        kv_set_json(scope, name, data)
+
+
+atexit.register(flush_group_saves)
+
+
+def clear_group_cache() -> None:
+    """Drop cached group values so the next read hits the database."""
+    flush_group_saves()
+    _group_values.clear()
+    _blacklist_casefolded.clear()
+
+
 class Storage:
     """Global storage manager for dashboard/API counters and cached group metadata."""
 
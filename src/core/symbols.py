@@ -5,6 +5,8 @@ Clean, minimal symbols that render well on WhatsApp.
 Use these instead of emojis for a more professional look.
 """
 
+from collections.abc import Iterable
+
 SUCCESS = "✓"
 ERROR = "✗"
 WARNING = "⊘"
@@ -59,13 +61,18 @@ CALENDAR = "▦"
 LOADING = "⏳"
 MUSIC = "♪"
 
+_BOX_TOP = f"{CORNER_UP}{LINE * 3} "
+_BOX_BOTTOM = f"\n{CORNER_DOWN}{LINE * 15}"
+_BOX_LINE = f"\n{PIPE} "
+_SECTION_ITEM = f"\n{BULLET} "
+
 
 def header(text: str) -> str:
     """Format text as a header with decorative brackets."""
     return f"{HEADER_L} {text} {HEADER_R}"
 
 
-def box(title: str, lines: list[str]) -> str:
+def box(title: str, lines: Iterable[str]) -> str:
     """
     Create a boxed message with title and content lines.
 
@@ -75,14 +82,11 @@ def box(title: str, lines: list[str]) -> str:
         │ Line 2
         ╰───────────────
     """
-    result = [f"{CORNER_UP}{LINE * 3} {title}"]
-    for line in lines:
-        result.append(f"{PIPE} {line}")
-    result.append(f"{CORNER_DOWN}{LINE * 15}")
-    return "\n".join(result)
+    body = "".join(f"{_BOX_LINE}{line}" for line in lines)
+    return f"{_BOX_TOP}{title}{body}{_BOX_BOTTOM}"
 
 
-def section(title: str, items: list[str]) -> str:
+def section(title: str, items: Iterable[str]) -> str:
     """
     Create a section with header and bullet points.
 
@@ -91,10 +95,8 @@ def section(title: str, items: list[str]) -> str:
         • Item 1
         • Item 2
     """
-    lines = [header(title)]
-    for item in items:
-        lines.append(f"{BULLET} {item}")
-    return "\n".join(lines)
+    body = "".join(f"{_SECTION_ITEM}{item}" for item in items)
+    return f"{header(title)}{body}"
 
 
 def status_line(label: str, value: str, enabled: bool | None = None) -> str:
@@ -4,31 +4,42 @@ Common utilities.
 
 from __future__ import annotations
 
-import re
 from datetime import timedelta
 
+_DURATION_UNITS = {"d": (0, 86400), "h": (1, 3600), "m": (2, 60), "s": (3, 1)}
+
 
 def parse_duration(duration_str: str) -> timedelta | None:
     """
     Parse a duration string like "10m", "2h", "1d30m" into a timedelta.
 
-    Supported units: d (days), h (hours), m (minutes), s (seconds)
+    Supported units: d (days), h (hours), m (minutes), s (seconds), each used
+    at most once and in that order. Scanned in a single pass without regex.
     """
-    pattern = r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?"
-    match = re.fullmatch(pattern, duration_str.lower().strip())
-
-    if not match:
+    total = 0
+    value = 0
+    has_digits = False
+    last_rank = -1
+
+    for char in duration_str.lower().strip():
+        if "0" <= char <= "9":
+            value = value * 10 + (ord(char) - 48)
+            has_digits = True
+            continue
+
+        unit = _DURATION_UNITS.get(char)
+        if unit is None or not has_digits or unit[0] <= last_rank:
+            return None
+
+        last_rank = unit[0]
+        total += value * unit[1]
+        value = 0
+        has_digits = False
+
+    if has_digits or total == 0:
         return None
 
-    days = int(match.group(1) or 0)
-    hours = int(match.group(2) or 0)
-    minutes = int(match.group(3) or 0)
-    seconds = int(match.group(4) or 0)
-
-    if days == 0 and hours == 0 and minutes == 0 and seconds == 0:
-        return None
-
-    return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return timedelta(seconds=total)
 
 
 def format_duration(td: timedelta) -> str:
@@ -38,17 +49,10 @@ def format_duration(td: timedelta) -> str:
     hours, remainder = divmod(remainder, 3600)
     minutes, seconds = divmod(remainder, 60)
 
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0:
-        parts.append(f"{seconds}s")
-
-    if not parts:
-        return "0s"
-
-    return " ".join(parts)
+    text = (
+        (f"{days}d " if days > 0 else "")
+        + (f"{hours}h " if hours > 0 else "")
+        + (f"{minutes}m " if minutes > 0 else "")
+        + (f"{seconds}s " if seconds > 0 else "")
+    )
+    return text[:-1] if text else "0s"
@@ -566,7 +566,7 @@ async def get_commands():
                 {
                     "name": cmd.name,
                     "description": cmd.description or "",
-                    "category": category,
+                    "category": category.title(),
                     "enabled": cmd.name not in disabled,
                 }
             )
@@ -1452,7 +1452,7 @@ async def get_blacklist(group_id: str):
     group_storage = GroupData(group_id)
     words = group_storage.blacklist
 
-    return {"words": words, "count": len(words)}
+    return {"words": sorted(words), "count": len(words)}
 
 
 @_api.post("/api/groups/{group_id}/blacklist")
@@ -1461,11 +1461,11 @@ async def add_blacklist_word(group_id: str, data: BlacklistWord):
     group_storage = GroupData(group_id)
     words = group_storage.blacklist
 
-    word = data.word.lower().strip()
+    word = data.word.casefold().strip()
     if word in words:
         raise HTTPException(status_code=400, detail=f"Word '{word}' already in blacklist")
 
-    words.append(word)
+    words.add(word)
     group_storage.save_blacklist(words)
 
     return {"success": True, "message": f"Word '{word}' added to blacklist"}
@@ -1474,14 +1474,14 @@ async def add_blacklist_word(group_id: str, data: BlacklistWord):
 @_api.delete("/api/groups/{group_id}/blacklist/{word}")
 async def remove_blacklist_word(group_id: str, word: str):
     """Remove a word from the blacklist."""
-    word = unquote(word).lower().strip()
+    word = unquote(word).casefold().strip()
     group_storage = GroupData(group_id)
     words = group_storage.blacklist
 
     if word not in words:
         raise HTTPException(status_code=404, detail=f"Word '{word}' not in blacklist")
 
-    words.remove(word)
+    words.discard(word)
     group_storage.save_blacklist(words)
 
     return {"success": True, "message": f"Word '{word}' removed from blacklist"}
@@ -50,6 +50,7 @@ from core.logger import (
     show_pair_help,
     show_qr_prompt,
 )
+from core.permissions import invalidate_admin_cache
 from core.runtime_config import runtime_config
 from core.scheduler import init_scheduler
 from core.session import session_state
@@ -132,6 +133,7 @@ def _init_bot(args):
     if args.dashboard:
         runtime_config._config.setdefault("dashboard", {})["enabled"] = True
 
+    from ai import agentic_ai
     from config.settings import AUTO_RELOAD, BOT_NAME, LOGIN_METHOD, PHONE_NUMBER
     from core.cache import message_cache
     from core.client import BotClient
@@ -372,6 +374,8 @@ def _init_bot(args):
         session_state.is_logged_in = True
         session_state.qr_code = None
         session_state.pair_code = None
+        agentic_ai.clear_bot_ids()
+        bot.clear_self_jid()
 
         show_connected(
             device=event.device.User,
@@ -399,6 +403,9 @@ def _init_bot(args):
             if not group_jid or not group_jid.endswith("@g.us"):
                 return
 
+            if event.Promote or event.Demote or event.Leave:
+                invalidate_admin_cache(group_jid)
+
             joined = list(event.Join)
             left = list(event.Leave)
 
@@ -609,7 +616,7 @@ def _init_bot(args):
                                 set_bot_reload(bot)
                                 log_success(f"[b]↻ Reloaded:[/b] {path.name} (core module)")
                             else:
-                                command_loader._commands.clear()
+                                command_loader.clear()
                                 count = command_loader.load_commands()
                                 log_success(f"[b]↻ Reloaded:[/b] {path.name} ({count} commands)")
                     except Exception as e:
@@ -0,0 +1,29 @@
+"""
+Shared pytest setup.
+
+Points the bot's data, log and config paths at a throwaway directory before
+any application module imports them, so test runs never write databases,
+logs or a generated config.json into the working tree.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import core.constants as constants
+
+_SANDBOX = Path(tempfile.mkdtemp(prefix="zero-ichi-tests-"))
+
+constants.BASE_DIR = _SANDBOX
+constants.DATA_DIR = _SANDBOX / "data"
+constants.LOGS_DIR = _SANDBOX / "logs"
+constants.DOWNLOADS_DIR = constants.DATA_DIR / "downloads"
+constants.MEDIA_DIR = constants.DATA_DIR / "media"
+constants.MEMORY_DIR = constants.DATA_DIR / "ai_memory"
+constants.SKILLS_DIR = constants.DATA_DIR / "ai_skills"
+constants.TASKS_FILE = constants.DATA_DIR / "scheduled_tasks.json"
+constants.DATA_DIR.mkdir()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_SANDBOX, ignore_errors=True)
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from ai import response_cache as cache_module
+from ai.agent import AgenticAI
+from ai.memory import clear_memory, get_memory
+from ai.response_cache import ResponseCache, make_cache_key, normalize_prompt, response_cache
+
+
+def test_normalized_prompts_share_a_key():
+    first = make_cache_key(normalize_prompt("  What is   THIS? "), "123@g.us", False, "text")
+    second = make_cache_key(normalize_prompt("what is this?"), "123@g.us", False, "text")
+    other_chat = make_cache_key(normalize_prompt("what is this?"), "456@g.us", False, "text")
+
+    assert first == second
+    assert first != other_chat
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache = ResponseCache(ttl=10.0)
+    cache.put("key", "answer")
+    assert cache.get("key") == "answer"
+
+    now[0] += 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_empty_output_is_not_cached():
+    cache = ResponseCache()
+    cache.put("key", "")
+    assert cache.get("key") is None
+
+
+class _FakeMessage:
+    text = "hello there"
+    chat_jid = "123@g.us"
+    sender_jid = "628@s.whatsapp.net"
+    sender_name = "tester"
+    raw_message = None
+    quoted_message = None
+
+    def _detect_media_type(self, raw):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_share_one_run(monkeypatch):
+    monkeypatch.setenv("AI_API_KEY", "test-key")
+    response_cache.clear()
+
+    ai = AgenticAI.__new__(AgenticAI)
+    ai._skills = {}
+    ai._bot_ids = []
+    ai._inflight = {}
+
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_run(msg, bot, message_type, quoted, cache_parts):
+        calls.append(cache_parts)
+        await release.wait()
+        return "hi!"
+
+    monkeypatch.setattr(ai, "_run", fake_run)
+
+    first = asyncio.create_task(ai.process(_FakeMessage(), None))
+    second = asyncio.create_task(ai.process(_FakeMessage(), None))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["hi!", "hi!"]
+    assert len(calls) == 1
+    assert ai._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_answer_is_tied_to_chat_history(monkeypatch):
+    monkeypatch.setenv("AI_API_KEY", "test-key")
+    response_cache.clear()
+    clear_memory("123@g.us")
+
+    ai = AgenticAI.__new__(AgenticAI)
+    ai._inflight = {}
+    runs = []
+
+    async def fake_run(msg, bot, message_type, quoted, cache_parts):
+        runs.append(msg.text)
+        memory = get_memory(msg.chat_jid)
+        memory.add(role="user", content=msg.text)
+        memory.add(role="assistant", content="first answer")
+        response_cache.put(make_cache_key(*cache_parts, memory.revision), "first answer")
+        return "first answer"
+
+    monkeypatch.setattr(ai, "_run", fake_run)
+
+    assert await ai.process(_FakeMessage(), None) == "first answer"
+    assert await ai.process(_FakeMessage(), None) == "first answer"
+    assert len(runs) == 1
+
+    get_memory("123@g.us").add(role="user", content="something else entirely")
+    await ai.process(_FakeMessage(), None)
+    assert len(runs) == 2
+
+    clear_memory("123@g.us")
+    response_cache.clear()
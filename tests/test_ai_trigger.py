@@ -0,0 +1,74 @@
+import pytest
+
+from ai import agent as ai_agent
+
+
+class _FakeMessage:
+    chat_jid = "123@g.us"
+    sender_jid = "628@s.whatsapp.net"
+    is_group = True
+    mentions: list[str] = []
+    quoted_message = None
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _configure(monkeypatch, **overrides):
+    settings = {"enabled": True, "trigger_mode": "mention", "owner_only": True, **overrides}
+
+    def fake_get_nested(*keys, default=None):
+        if keys[0] == "agentic_ai":
+            return settings.get(keys[1], default)
+        return default
+
+    monkeypatch.setenv("AI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_agent.runtime_config, "get_nested", fake_get_nested)
+    monkeypatch.setattr(ai_agent.runtime_config, "_config", {"bot": {"name": "Zero Ichi"}})
+
+
+@pytest.mark.asyncio
+async def test_untriggered_messages_skip_owner_lookup(monkeypatch):
+    _configure(monkeypatch)
+    owner_checks = []
+
+    async def fake_is_owner(jid, client=None):
+        owner_checks.append(jid)
+        return True
+
+    monkeypatch.setattr(ai_agent.runtime_config, "is_owner_async", fake_is_owner)
+
+    ai = ai_agent.AgenticAI()
+    ai._bot_ids = ["999"]
+
+    assert not await ai.should_respond(_FakeMessage("just chatting"), object())
+    assert owner_checks == []
+
+    assert await ai.should_respond(_FakeMessage("hey zero ichi, help"), object())
+    assert await ai.should_respond(_FakeMessage("@999 ping"), object())
+    assert len(owner_checks) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_owner_is_rejected_after_trigger(monkeypatch):
+    _configure(monkeypatch)
+
+    async def fake_is_owner(jid, client=None):
+        return False
+
+    monkeypatch.setattr(ai_agent.runtime_config, "is_owner_async", fake_is_owner)
+
+    ai = ai_agent.AgenticAI()
+    assert not await ai.should_respond(_FakeMessage("zero ichi?"), object())
+
+
+def test_mentions_match_bot_ids_by_user_part():
+    ai = ai_agent.AgenticAI()
+
+    msg = _FakeMessage("hi all")
+    msg.mentions = ["111@s.whatsapp.net", "999@lid"]
+    assert ai._is_mentioned(msg, ["555", "999"])
+
+    msg.mentions = ["111@s.whatsapp.net"]
+    assert not ai._is_mentioned(msg, ["555", "999"])
+    assert ai._is_mentioned(_FakeMessage("ping @555"), ["555", "999"])
@@ -0,0 +1,398 @@
+import pytest
+
+from core.client import BotClient
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, to, message, **kwargs):
+        self.sent.append((to, message))
+        return message
+
+
+@pytest.mark.asyncio
+async def test_send_collects_mentions():
+    raw = _RecordingClient()
+    bot = BotClient(raw)
+
+    await bot.send("123@g.us", "hi @111 and @222!")
+    to, message = raw.sent[-1]
+    assert (to.User, to.Server) == ("123", "g.us")
+    assert message.extendedTextMessage.text == "hi @111 and @222!"
+    assert list(message.extendedTextMessage.contextInfo.mentionedJID) == ["111@lid", "222@lid"]
+
+    await bot.send("123@g.us", "ping @333", mentions_are_lids=False)
+    _, message = raw.sent[-1]
+    assert list(message.extendedTextMessage.contextInfo.mentionedJID) == ["333@s.whatsapp.net"]
+
+
+@pytest.mark.asyncio
+async def test_send_without_mentions_leaves_context_empty():
+    raw = _RecordingClient()
+    bot = BotClient(raw)
+
+    await bot.send("628", "plain text")
+    to, message = raw.sent[-1]
+    assert (to.User, to.Server) == ("628", "s.whatsapp.net")
+    assert list(message.extendedTextMessage.contextInfo.mentionedJID) == []
+
+
+def test_to_jid_reuses_built_jids():
+    bot = BotClient(_RecordingClient())
+
+    group = bot.to_jid("123@g.us")
+    assert (group.User, group.Server) == ("123", "g.us")
+    assert bot.to_jid("123@g.us") is group
+    assert bot.to_jid(group) is group
+    assert bot.to_jid("628").Server == "s.whatsapp.net"
+
+
+@pytest.mark.asyncio
+async def test_status_checks_handle_sync_and_async_clients():
+    class _SyncStatus(_RecordingClient):
+        is_connected = True
+        is_logged_in = False
+
+    class _AsyncStatus(_RecordingClient):
+        @property
+        def is_connected(self):
+            async def probe():
+                return True
+
+            return probe()
+
+        is_logged_in = is_connected
+
+    sync_bot = BotClient(_SyncStatus())
+    assert await sync_bot.check_connected() is True
+    assert await sync_bot.check_logged_in() is False
+
+    async_bot = BotClient(_AsyncStatus())
+    for _ in range(2):
+        assert await async_bot.check_connected() is True
+        assert await async_bot.check_logged_in() is True
+
+
+@pytest.mark.asyncio
+async def test_forward_marks_media_and_upgrades_plain_text_quotes():
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import ImageMessage, Message
+
+    raw = _RecordingClient()
+    bot = BotClient(raw)
+
+    await bot.forward_message("123@g.us", Message(imageMessage=ImageMessage(caption="x")), score=5)
+    _, message = raw.sent[-1]
+    assert message.imageMessage.contextInfo.isForwarded
+    assert message.imageMessage.contextInfo.forwardingScore == 5
+
+    quoted = Message(conversation="original")
+    await bot.forward_message_with_quote(
+        "123@g.us", Message(conversation="hello"), "ID1", quoted, quoted_participant="628@lid"
+    )
+    _, message = raw.sent[-1]
+    assert not message.HasField("conversation")
+    assert message.extendedTextMessage.text == "hello"
+    context = message.extendedTextMessage.contextInfo
+    assert (context.stanzaID, context.participant) == ("ID1", "628@lid")
+    assert context.quotedMessage == quoted
+    assert context.isForwarded
+
+
+def test_apply_forwarded_targets_the_payload_field():
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import (
+        ExtendedTextMessage,
+        Message,
+        MessageContextInfo,
+        StickerMessage,
+    )
+
+    bot = BotClient(_RecordingClient())
+
+    message = Message(
+        messageContextInfo=MessageContextInfo(deviceListMetadataVersion=2),
+        stickerMessage=StickerMessage(),
+    )
+    bot._apply_forwarded(message, 3)
+    assert message.stickerMessage.contextInfo.forwardingScore == 3
+
+    both = Message(stickerMessage=StickerMessage(), extendedTextMessage=ExtendedTextMessage())
+    bot._apply_forwarded(both)
+    assert both.extendedTextMessage.contextInfo.isForwarded
+    assert not both.stickerMessage.HasField("contextInfo")
+
+
+@pytest.mark.asyncio
+async def test_send_buttons_builds_native_flow_buttons():
+    import json
+
+    raw = _RecordingClient()
+    bot = BotClient(raw)
+    buttons = [
+        {"type": "copy", "text": "Copy", "code": "123"},
+        {"type": "URL", "text": "Open", "url": "https://example.com"},
+        {"type": "call", "text": "Call"},
+        {"type": "unknown", "text": "Skipped"},
+    ]
+
+    await bot.send_buttons("123@g.us", "body", buttons, footer="foot")
+    _, message = raw.sent[-1]
+    interactive = message.interactiveMessage
+    assert interactive.HasField("contextInfo")
+    assert not interactive.contextInfo.isForwarded
+
+    native = interactive.nativeFlowMessage.buttons
+    assert [b.name for b in native] == ["cta_copy", "cta_url", "cta_call"]
+    assert [json.loads(b.buttonParamsJSON) for b in native] == [
+        {"display_text": "Copy", "id": "copy_Copy", "copy_code": "123"},
+        {
+            "display_text": "Open",
+            "url": "https://example.com",
+            "merchant_url": "https://example.com",
+        },
+        {"display_text": "Call", "id": "call_Call"},
+    ]
+
+    await bot.send_buttons("123@g.us", "body", buttons[:1], forwarded=True)
+    _, message = raw.sent[-1]
+    assert message.interactiveMessage.contextInfo.forwardingScore == 999
+
+
+def test_apply_forwarded_leaves_plain_conversation_alone():
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import Message
+
+    bot = BotClient(_RecordingClient())
+    message = bot._apply_forwarded(Message(conversation="hi"))
+    assert message.conversation == "hi"
+    assert not message.HasField("extendedTextMessage")
+
+
+def test_normalize_user_jid():
+    assert BotClient.normalize_user_jid(" @12345 ") == "12345@lid"
+    assert BotClient.normalize_user_jid("628123", use_lid=False) == "628123@s.whatsapp.net"
+    assert BotClient.normalize_user_jid("12345@lid ") == "12345@lid"
+    assert BotClient.normalize_user_jid("628@s.whatsapp.net", use_lid=True) == "628@s.whatsapp.net"
+
+
+@pytest.mark.asyncio
+async def test_send_quoted_reuses_own_jid():
+    class _Device:
+        class JID:
+            User = "999"
+            Server = "s.whatsapp.net"
+
+    class _WithMe(_RecordingClient):
+        me_calls = 0
+
+        async def get_me(self):
+            self.me_calls += 1
+            return _Device()
+
+    raw = _WithMe()
+    bot = BotClient(raw)
+
+    for _ in range(2):
+        await bot.send_quoted("123@g.us", "reply", "ID1", quoted_text="original")
+    _, message = raw.sent[-1]
+    context = message.extendedTextMessage.contextInfo
+    assert context.participant == "999@s.whatsapp.net"
+    assert context.quotedMessage.conversation == "original"
+    assert raw.me_calls == 1
+
+    bot.clear_self_jid()
+    await bot.send_quoted("123@g.us", "reply", "ID2")
+    assert raw.me_calls == 2
+
+
+@pytest.mark.parametrize(
+    "button",
+    [
+        {"type": "copy", "text": 'Say "hi"', "code": 42},
+        {"type": "url", "text": "Café \U0001f600", "url": "https://example.com/a\\b"},
+        {"type": "call", "text": "line\nbreak\ttab"},
+    ],
+)
+def test_button_params_match_json_dumps(button):
+    import json
+
+    from core import client as client_module
+
+    native = client_module._BUTTON_BUILDERS[button["type"]](button["text"], button)
+    params = json.loads(native.buttonParamsJSON)
+    assert native.buttonParamsJSON == json.dumps(params, separators=(",", ":"))
+
+
+def test_bot_client_has_no_instance_dict():
+    bot = BotClient(_RecordingClient())
+    bot.message_cache = object()
+
+    assert not hasattr(bot, "__dict__")
+    with pytest.raises(AttributeError):
+        bot.unexpected = True
+
+
+@pytest.mark.asyncio
+async def test_reply_privately_sets_quote_only_when_text_given():
+    raw = _RecordingClient()
+    bot = BotClient(raw)
+
+    await bot.reply_privately_to("628", "dm", "ID1", "111@lid", "123@g.us", quoted_text="orig")
+    _, message = raw.sent[-1]
+    context = message.extendedTextMessage.contextInfo
+    assert (context.remoteJID, context.quotedMessage.conversation) == ("123@g.us", "orig")
+
+    await bot.reply_privately_to("628", "dm", "ID1", "111@lid", "123@g.us")
+    _, message = raw.sent[-1]
+    assert not message.extendedTextMessage.contextInfo.HasField("quotedMessage")
+
+
+class _Upload:
+    url = "https://mmg.whatsapp.net/stub"
+    FileSHA256 = b"sha"
+    MediaKey = b"key"
+    FileEncSHA256 = b"enc"
+    DirectPath = "/stub"
+
+
+class _UploadingClient(_RecordingClient):
+    def __init__(self):
+        super().__init__()
+        self.uploads = []
+
+    async def upload(self, data):
+        self.uploads.append(data)
+        return _Upload()
+
+
+@pytest.mark.asyncio
+async def test_send_menu_document_uses_stub_payload():
+    raw = _UploadingClient()
+    bot = BotClient(raw)
+
+    await bot.send_menu_document("123@g.us", "Menu", "body")
+    _, message = raw.sent[-1]
+    document = message.documentMessage
+    assert raw.uploads[0][:4] == b"PK\x03\x04"
+    assert document.fileLength == len(raw.uploads[0]) == 250
+    assert (document.title, document.caption) == ("Menu", "body")
+    assert document.contextInfo.isForwarded
+
+
+@pytest.mark.asyncio
+async def test_menu_stub_upload_is_reused_until_a_send_fails():
+    class _FlakyClient(_UploadingClient):
+        fail_next = False
+
+        async def send_message(self, to, message, **kwargs):
+            if self.fail_next:
+                self.fail_next = False
+                raise RuntimeError("media rejected")
+            return await super().send_message(to, message, **kwargs)
+
+    raw = _FlakyClient()
+    bot = BotClient(raw)
+
+    await bot.send_menu_document("123@g.us", "Menu", "one")
+    await bot.send_menu_document("456@g.us", "Menu", "two")
+    assert len(raw.uploads) == 1
+
+    raw.fail_next = True
+    with pytest.raises(RuntimeError):
+        await bot.send_menu_document("123@g.us", "Menu", "three")
+    await bot.send_menu_document("123@g.us", "Menu", "four")
+    assert len(raw.uploads) == 2
+
+
+@pytest.mark.asyncio
+async def test_leave_group_defaults_to_group_server():
+    class _Leaver(_RecordingClient):
+        left = None
+
+        async def leave_group(self, jid):
+            self.left = jid
+
+    raw = _Leaver()
+    bot = BotClient(raw)
+
+    await bot.leave_group("123")
+    assert (raw.left.User, raw.left.Server) == ("123", "g.us")
+    await bot.leave_group("456@g.us")
+    assert raw.left is bot.to_jid("456@g.us")
+
+
+@pytest.mark.asyncio
+async def test_send_media_routes_by_type():
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import Message, StickerMessage
+
+    class _Builder(_RecordingClient):
+        async def build_sticker_message(self, file, quoted=None, **kwargs):
+            return Message(stickerMessage=StickerMessage())
+
+    raw = _Builder()
+    bot = BotClient(raw)
+
+    await bot.send_media("123@g.us", "STICKER", b"webp", forwarded=True)
+    _, message = raw.sent[-1]
+    assert message.stickerMessage.contextInfo.isForwarded
+
+    await bot.send_media("123@g.us", "hologram", b"?", caption="hi")
+    _, message = raw.sent[-1]
+    assert message == "[hologram] hi"
+
+
+@pytest.mark.asyncio
+async def test_private_media_reply_quotes_original():
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import ImageMessage, Message
+
+    class _Builder(_RecordingClient):
+        async def build_image_message(self, file, caption="", **kwargs):
+            return Message(imageMessage=ImageMessage(caption=caption))
+
+    raw = _Builder()
+    bot = BotClient(raw)
+
+    await bot.send_media_with_private_reply(
+        "628", "Image", b"jpg", "cap", "ID1", "111@lid", "123@g.us", "orig"
+    )
+    _, message = raw.sent[-1]
+    context = message.imageMessage.contextInfo
+    assert (context.stanzaID, context.remoteJID) == ("ID1", "123@g.us")
+    assert context.quotedMessage.conversation == "orig"
+
+
+@pytest.mark.asyncio
+async def test_group_lookups_cache_names_and_detect_admin():
+    from types import SimpleNamespace as NS
+
+    me = NS(JID=NS(User="628", Server="s.whatsapp.net"), LID=NS(User="999"))
+    group_info = NS(
+        GroupName=NS(Name="Team"),
+        Participants=[
+            NS(JID=NS(User="111"), IsAdmin=False, IsSuperAdmin=False),
+            NS(JID=NS(User="999"), IsAdmin=True, IsSuperAdmin=False),
+        ],
+    )
+
+    class _Groups(_RecordingClient):
+        info_calls = 0
+
+        async def get_group_info(self, jid):
+            self.info_calls += 1
+            return group_info
+
+        async def get_me(self):
+            return me
+
+        async def get_joined_groups(self):
+            return [NS(JID=NS(User="123", Server="g.us"), **vars(group_info))]
+
+    raw = _Groups()
+    bot = BotClient(raw)
+
+    assert await bot.get_group_name("123@g.us") == "Team"
+    assert await bot.get_group_name(bot.to_jid("123@g.us")) == "Team"
+    assert raw.info_calls == 1
+
+    groups = await bot.get_joined_groups()
+    assert groups == [{"id": "123@g.us", "name": "Team", "member_count": 2, "is_admin": True}]
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import core.analytics as analytics_module
+import core.db as db_module
+
+
+def _reset_db(tmp_path: Path, monkeypatch) -> None:
+    db_file = tmp_path / "test.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_file.as_posix()}")
+    db_module._engine = None
+    db_module._ready = False
+    db_module.ensure_database_ready()
+
+
+def test_recorded_commands_are_counted(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+    analytics = analytics_module.CommandAnalytics()
+
+    for name in ("ping", "help", "ping"):
+        analytics.record_command(name, "628@s.whatsapp.net", "123@g.us")
+    analytics.record_command("ping", "628@s.whatsapp.net", "456@g.us")
+
+    assert analytics.get_top_commands() == [
+        {"command": "ping", "count": 3},
+        {"command": "help", "count": 1},
+    ]
+    assert analytics.get_total_commands(chat_jid="123@g.us") == 3
+
+    timeline = analytics.get_usage_timeline("ping", days=3)
+    assert [entry["count"] for entry in timeline] == [0, 0, 3]
+
+
+def test_legacy_payload_is_migrated(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+
+    recent = datetime.now().isoformat()
+    expired = (datetime.now() - timedelta(days=40)).isoformat()
+    db_module.kv_set_json(
+        "analytics",
+        "payload",
+        {
+            "commands": {
+                "ping": [
+                    {"ts": recent, "user": "628", "chat": "123@g.us"},
+                    {"ts": expired, "user": "628", "chat": "123@g.us"},
+                ]
+            }
+        },
+    )
+
+    analytics = analytics_module.CommandAnalytics()
+
+    assert db_module.kv_get_json("analytics", "payload") is None
+    assert analytics.get_total_commands(days=60) == 2
+
+    analytics.record_command("help")
+    assert analytics.get_total_commands(days=60) == 2
+    assert analytics.get_top_commands(days=60) == [
+        {"command": "help", "count": 1},
+        {"command": "ping", "count": 1},
+    ]
+
+
+def test_failed_save_keeps_pending_records(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+    analytics = analytics_module.CommandAnalytics()
+    analytics.record_command("ping")
+
+    def locked(events):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(analytics_module, "insert_command_events", locked)
+    analytics.record_command("help")
+    analytics.flush()
+    analytics.record_command("sticker")
+    analytics.flush()
+    assert [event["name"] for event in analytics._pending] == ["help", "sticker"]
+
+    monkeypatch.undo()
+    _reset_db(tmp_path, monkeypatch)
+    analytics.flush()
+    assert analytics._pending == []
+    assert analytics.get_total_commands() == 3
+
+
+def test_failing_saves_back_off_and_cap_the_buffer(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+    monkeypatch.setattr(analytics_module, "SAVE_BATCH_SIZE", 2)
+    monkeypatch.setattr(analytics_module, "MAX_PENDING_EVENTS", 3)
+    analytics = analytics_module.CommandAnalytics()
+
+    attempts = []
+
+    def locked(events):
+        attempts.append(len(events))
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(analytics_module, "insert_command_events", locked)
+    for i in range(6):
+        analytics.record_command(f"cmd{i}")
+    assert attempts == [1]
+
+    analytics.flush()
+    assert attempts == [1, 6]
+    assert [event["name"] for event in analytics._pending] == ["cmd3", "cmd4", "cmd5"]
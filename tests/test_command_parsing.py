@@ -0,0 +1,96 @@
+import pytest
+
+from core import command as command_module
+from core.runtime_config import runtime_config
+
+
+def _loader(monkeypatch, prefix: str) -> command_module.CommandLoader:
+    monkeypatch.setattr(runtime_config, "_config", {"bot": {"prefix": prefix}})
+    return command_module.CommandLoader()
+
+
+def _command(name: str, *aliases: str) -> command_module.Command:
+    class _Cmd(command_module.Command):
+        async def execute(self, ctx) -> None:
+            pass
+
+    _Cmd.name = name
+    _Cmd.aliases = list(aliases)
+    return _Cmd()
+
+
+@pytest.mark.parametrize("prefix", ["[!/.]", "^#", "(hey)", "a+", "\\."])
+def test_regex_prefixes_are_detected(prefix):
+    assert command_module._REGEX_CHARS_RE.search(prefix)
+
+
+def test_literal_prefix_parses_commands(monkeypatch):
+    loader = _loader(monkeypatch, "!")
+
+    assert loader.parse_command("!Ping  a b ") == ("ping", "a b", ["a", "b"])
+    assert loader.parse_command("!say hi\n  there") == ("say", "hi\n  there", ["hi", "there"])
+    assert loader.parse_command("ping") == (None, "", [])
+    assert loader.parse_command("!") == (None, "", [])
+    assert not loader._prefix_is_regex
+
+
+def test_empty_prefix_only_matches_known_commands(monkeypatch):
+    loader = _loader(monkeypatch, "")
+    loader.register(_command("ping"))
+
+    assert loader.parse_command("ping now") == ("ping", "now", ["now"])
+    assert loader.parse_command("hello there") == (None, "", [])
+
+
+def test_regex_prefix_parses_commands(monkeypatch):
+    loader = _loader(monkeypatch, "[!/.]")
+
+    assert loader.parse_command(".help menu") == ("help", "menu", ["menu"])
+    assert loader.parse_command("/help")[0] == "help"
+    assert loader.parse_command("#help")[0] is None
+    assert loader._prefix_is_regex
+
+
+def test_prefix_is_refreshed_when_config_version_changes(monkeypatch):
+    loader = _loader(monkeypatch, "!")
+    assert loader.parse_command("!ping")[0] == "ping"
+
+    monkeypatch.setattr(runtime_config, "_config", {"bot": {"prefix": "/"}})
+    assert loader.parse_command("/ping")[0] is None
+
+    monkeypatch.setattr(runtime_config, "_version", runtime_config.version + 1)
+    assert loader.parse_command("/ping")[0] == "ping"
+    assert loader.parse_command("!ping")[0] is None
+
+
+def test_unique_command_cache_follows_registry_changes(monkeypatch):
+    loader = _loader(monkeypatch, "!")
+    loader.register(_command("ping", "p"))
+
+    assert [c.name for c in loader.unique_commands] == ["ping"]
+    assert loader.find_similar("pnig") == ["ping"]
+
+    loader.register(_command("sticker", "s"))
+    assert loader.find_similar("stiker") == ["sticker"]
+
+    assert loader.unregister("p").name == "ping"
+    assert loader.get("ping") is None
+    assert loader.find_similar("pnig") == []
+
+    loader.clear()
+    assert loader.unique_commands == []
+
+
+def test_grouped_commands_are_keyed_by_lowercase_category(monkeypatch):
+    from core import symbols as sym
+    from core.help_utils import category_icon
+
+    loader = _loader(monkeypatch, "!")
+    ping = _command("ping")
+    ping.category = "General"
+    loader.register(ping)
+    loader.register(_command("misc"))
+
+    assert list(loader.get_grouped_commands()) == ["general", "other"]
+    assert category_icon("general") == sym.INFO
+    assert category_icon("downloader") == sym.DIAMOND
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+import pytest
+
+from core.utils import format_duration, parse_duration
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("10m", timedelta(minutes=10)),
+        ("2h", timedelta(hours=2)),
+        ("1d30m", timedelta(days=1, minutes=30)),
+        ("1d2h3m4s", timedelta(days=1, hours=2, minutes=3, seconds=4)),
+        (" 5S ", timedelta(seconds=5)),
+        ("1d0s", timedelta(days=1)),
+    ],
+)
+def test_parse_duration_valid(text, expected):
+    assert parse_duration(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "10", "m", "0m", "1h1h", "1m1h", "1x", "1h 2m"])
+def test_parse_duration_invalid(text):
+    assert parse_duration(text) is None
+
+
+def test_format_duration_roundtrip():
+    assert format_duration(parse_duration("1d2h3m4s")) == "1d 2h 3m 4s"
+    assert format_duration(timedelta()) == "0s"
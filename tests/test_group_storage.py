@@ -0,0 +1,205 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import core.db as db_module
+import core.storage as storage_module
+
+
+def _reset_db(tmp_path: Path, monkeypatch) -> None:
+    db_file = tmp_path / "test.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_file.as_posix()}")
+    db_module._engine = None
+    db_module._ready = False
+    db_module.ensure_database_ready()
+    storage_module.clear_group_cache()
+
+
+def test_group_data_is_shared_per_jid(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+
+    first = storage_module.get_group_data("123@g.us")
+    assert storage_module.get_group_data("123@g.us") is first
+
+
+def test_group_values_are_cached_and_isolated(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+
+    data = storage_module.GroupData("123@g.us")
+    warnings = data.warnings
+    warnings["628"] = ["spam"]
+    data.save_warnings(warnings)
+
+    calls = []
+    monkeypatch.setattr(storage_module, "kv_get_json", lambda *args, **kwargs: calls.append(args))
+
+    loaded = storage_module.GroupData("123@g.us").warnings
+    assert loaded == {"628": ["spam"]}
+    assert calls == []
+
+    loaded["628"].append("mutated")
+    assert data.warnings == {"628": ["spam"]}
+
+
+@pytest.mark.asyncio
+async def test_deferred_saves_are_coalesced(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+
+    writes = []
+    real_set = storage_module.kv_set_json
+    monkeypatch.setattr(
+        storage_module,
+        "kv_set_json",
+        lambda scope, key, value: (writes.append(key), real_set(scope, key, value)),
+    )
+
+    data = storage_module.get_group_data("123@g.us")
+    for limit in (2, 4, 5):
+        config = data.warnings_config
+        config["limit"] = limit
+        data.save_warnings_config_deferred(config)
+
+    assert data.warnings_config["limit"] == 5
+    assert writes == []
+
+    await asyncio.sleep(storage_module.DEFERRED_SAVE_DELAY + 0.1)
+
+    assert writes == ["warnings_config"]
+    assert db_module.kv_get_json(data.scope, "warnings_config")["limit"] == 5
+
+
+def test_blacklist_casefolded_tracks_saves(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+
+    data = storage_module.get_group_data("123@g.us")
+    assert data.blacklist_casefolded == frozenset()
+
+    data.save_blacklist({"Straße", "spam"})
+    folded = data.blacklist_casefolded
+    assert folded == {"strasse", "spam"}
+    assert data.blacklist_casefolded is folded
+
+    data.save_blacklist({"spam"})
+    assert data.blacklist_casefolded == {"spam"}
+
+
+def test_group_value_cache_is_bounded(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+    monkeypatch.setattr(storage_module, "GROUP_VALUE_CACHE_SIZE", 2)
+
+    first = storage_module.GroupData("1@g.us")
+    first.save_blacklist({"spam"})
+    assert first.blacklist_casefolded == {"spam"}
+
+    storage_module.GroupData("2@g.us").save_notes({"a": "b"})
+    storage_module.GroupData("3@g.us").save_notes({"c": "d"})
+
+    assert len(storage_module._group_values) == 2
+    assert (first.scope, "blacklist") not in storage_module._group_values
+    assert first.scope not in storage_module._blacklist_casefolded
+    assert first.blacklist == {"spam"}
+
+
+def test_evicted_value_reads_pending_deferred_save(tmp_path, monkeypatch):
+    _reset_db(tmp_path, monkeypatch)
+    monkeypatch.setattr(storage_module, "GROUP_VALUE_CACHE_SIZE", 1)
+
+    data = storage_module.GroupData("1@g.us")
+    config = data.warnings_config
+    config["limit"] = 7
+    storage_module._pending_saves[(data.scope, "warnings_config")] = config
+
+    storage_module.GroupData("2@g.us").save_notes({})
+    assert data.warnings_config["limit"] == 7
+    storage_module.flush_group_saves()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_warns_keep_both_counts(tmp_path, monkeypatch):
+    from commands.moderation import warn as warn_module
+
+    _reset_db(tmp_path, monkeypatch)
+    gate = asyncio.Event()
+
+    async def slow_bot_admin_check(client, group_jid):
+        await gate.wait()
+        return False
+
+    monkeypatch.setattr(warn_module, "check_bot_admin", slow_bot_admin_check)
+
+    data = storage_module.get_group_data("123@g.us")
+    config = data.warnings_config
+    config["limit"] = 1
+    data.save_warnings_config(config)
+
+    async def reply(message, text):
+        pass
+
+    def ctx(user: str):
+        message = SimpleNamespace(chat_jid="123@g.us", mentions=[], quoted_message=None)
+        return SimpleNamespace(
+            message=message,
+            args=[user, "spam"],
+            raw_args=f"{user} spam",
+            client=SimpleNamespace(reply=reply),
+        )
+
+    command = warn_module.WarnCommand()
+    first = asyncio.create_task(command.execute(ctx("628")))
+    second = asyncio.create_task(command.execute(ctx("629")))
+    await asyncio.sleep(0.05)
+    gate.set()
+    await asyncio.gather(first, second)
+
+    expected = {"628": ["spam"], "629": ["spam"]}
+    assert data.warnings == expected
+    assert db_module.kv_get_json(data.scope, "warnings") == expected
+
+
+@pytest.mark.asyncio
+async def test_warn_kick_writes_warnings_once(tmp_path, monkeypatch):
+    from commands.moderation import warn as warn_module
+
+    _reset_db(tmp_path, monkeypatch)
+
+    async def is_bot_admin(client, group_jid):
+        return True
+
+    monkeypatch.setattr(warn_module, "check_bot_admin", is_bot_admin)
+
+    data = storage_module.get_group_data("123@g.us")
+    config = data.warnings_config
+    config["limit"] = 1
+    data.save_warnings_config(config)
+
+    writes = []
+    real_set = storage_module.kv_set_json
+    monkeypatch.setattr(
+        storage_module,
+        "kv_set_json",
+        lambda scope, key, value: (writes.append(key), real_set(scope, key, value)),
+    )
+
+    kicked = []
+
+    async def update_group_participants(group, users, action):
+        kicked.append(action)
+
+    async def reply(message, text):
+        pass
+
+    client = SimpleNamespace(
+        reply=reply,
+        to_jid=lambda jid: jid,
+        _client=SimpleNamespace(update_group_participants=update_group_participants),
+    )
+    message = SimpleNamespace(chat_jid="123@g.us", mentions=[], quoted_message=None)
+    ctx = SimpleNamespace(message=message, args=["628", "spam"], raw_args="628 spam", client=client)
+
+    await warn_module.WarnCommand().execute(ctx)
+
+    assert kicked == ["remove"]
+    assert writes == ["warnings"]
+    assert db_module.kv_get_json(data.scope, "warnings") == {"628": []}
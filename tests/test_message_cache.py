@@ -0,0 +1,77 @@
+import pickle
+import time
+import zlib
+
+import pytest
+
+import core.cache as cache_module
+
+
+def _make_cache(tmp_path, monkeypatch, **kwargs) -> cache_module.MessageCache:
+    monkeypatch.setattr(cache_module, "DATA_DIR", tmp_path)
+    return cache_module.MessageCache(**kwargs)
+
+
+def test_store_and_remove_roundtrip(tmp_path, monkeypatch):
+    cache = _make_cache(tmp_path, monkeypatch)
+
+    cache.store("msg-1", {"text": "hello", "sender": "628@s.whatsapp.net"})
+    assert cache.get("msg-1") == {"text": "hello", "sender": "628@s.whatsapp.net"}
+
+    assert cache.remove("msg-1")["text"] == "hello"
+    assert cache.get("msg-1") is None
+    cache.close()
+
+
+def test_overflow_is_trimmed_periodically(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "TRIM_EVERY_WRITES", 4)
+    cache = _make_cache(tmp_path, monkeypatch, max_size=2)
+
+    for i in range(3):
+        cache.store(f"msg-{i}", {"text": str(i)})
+    assert len(cache) == 3
+
+    cache.store("msg-3", {"text": "3"})
+    assert len(cache) == 2
+    assert cache.get("msg-0") is None
+    assert cache.get("msg-3") == {"text": "3"}
+    cache.close()
+
+
+def test_legacy_zlib_blobs_are_still_readable(tmp_path, monkeypatch):
+    cache = _make_cache(tmp_path, monkeypatch)
+
+    blob = zlib.compress(pickle.dumps({"text": "old"}))
+    conn = cache._get_conn()
+    conn.execute(
+        "INSERT INTO messages (id, timestamp, data) VALUES (?, ?, ?)",
+        ("legacy", time.time(), blob),
+    )
+    conn.commit()
+
+    assert cache.get("legacy") == {"text": "old"}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_store_and_get(tmp_path, monkeypatch):
+    cache = _make_cache(tmp_path, monkeypatch)
+
+    await cache.store_async("msg-1", {"text": "hi", "message_bytes": b"\x01\x02"})
+    assert await cache.get_async("msg-1") == {"text": "hi", "message_bytes": b"\x01\x02"}
+    assert await cache.get_async("missing") is None
+    cache.close()
+
+
+def test_protobuf_message_is_stored_as_bytes(tmp_path, monkeypatch):
+    from neonize.proto.waE2E.WAWebProtobufsE2E_pb2 import Message
+
+    cache = _make_cache(tmp_path, monkeypatch)
+    message = Message(conversation="hello")
+
+    cache.store("msg-1", {"text": "hello", "message": message})
+    cached = cache.get("msg-1")
+
+    assert "message" not in cached
+    assert Message.FromString(cached["message_bytes"]) == message
+    cache.close()